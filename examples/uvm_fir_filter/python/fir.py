@@ -1,4 +1,7 @@
+import os
+
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 
 
@@ -6,6 +9,12 @@ from fpga_fir_toolkit.filter_design import design_fir_lowpass, apply_fir_filter
 from fpga_fir_toolkit.fixed_point import float_to_fixed_point, apply_fixed_point_filter, apply_fixed_point_filter_8bit_adc
 from fpga_fir_toolkit.adc_simulation import simulate_8bit_adc
 
+# Set FIR_NO_PLOT=1 to skip all figure rendering (e.g. for CI or benchmark runs).
+# No figure exists yet, so the backend can still be switched here
+PLOT = not os.environ.get('FIR_NO_PLOT')
+if not PLOT:
+    matplotlib.use('Agg')
+
 
 # Generate a test signal
 sample_rate = 1000  # Hz
@@ -23,17 +32,18 @@ fir_coefficients = design_fir_lowpass(cutoff_freq, sample_rate, num_taps)
 filtered_signal = apply_fir_filter(signal, fir_coefficients)
 
 # Plotting results
-plt.figure(figsize=(10, 6))
-plt.plot(t, signal, label='Original Signal', alpha=0.7)
-# Adjust time axis for filtered signal due to 'valid' mode in convolve
-plt.plot(t, filtered_signal, label='Filtered Signal', color='red')
-plt.title('FIR Low-Pass Filter Example')
-plt.xlabel('Time (s)')
-plt.ylabel('Amplitude')
-plt.legend()
-plt.grid(True)
-# plt.show()
-# plt.savefig("filtered.png")
+if PLOT:
+    plt.figure(figsize=(10, 6))
+    plt.plot(t, signal, label='Original Signal', alpha=0.7)
+    # Adjust time axis for filtered signal due to 'valid' mode in convolve
+    plt.plot(t, filtered_signal, label='Filtered Signal', color='red')
+    plt.title('FIR Low-Pass Filter Example')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Amplitude')
+    plt.legend()
+    plt.grid(True)
+    # plt.show()
+    # plt.savefig("filtered.png")
 
 
 # Convert coefficients to 16-bit fixed point (Q1.15 format)
@@ -52,32 +62,34 @@ print(f"Maximum quantization error: {max_error:.2e}")
 
 # Test the fixed-point filter
 fixed_filtered, info = apply_fixed_point_filter(signal, fixed_coeffs, scale)
-float_filtered = apply_fir_filter(signal, fir_coefficients)
+float_filtered = filtered_signal  # Same input and coefficients as above
 
 # Compare results
-plt.figure(figsize=(12, 8))
-
-plt.subplot(2, 1, 1)
-plt.plot(t, signal, label='Original Signal', alpha=0.7)
-plt.plot(t, float_filtered, label='Float Filter', color='red', linewidth=2)
-plt.plot(t, fixed_filtered, label='Fixed-Point Filter', color='green', linestyle='--', linewidth=2)
-plt.title('Comparison: Floating-Point vs Fixed-Point Filter')
-plt.xlabel('Time (s)')
-plt.ylabel('Amplitude')
-plt.legend()
-plt.grid(True)
-
-plt.subplot(2, 1, 2)
 error = float_filtered - fixed_filtered
-plt.plot(t, error)
-plt.title('Error between Float and Fixed-Point Filters')
-plt.xlabel('Time (s)')
-plt.ylabel('Error')
-plt.grid(True)
 
-plt.tight_layout()
-# plt.show()
-# plt.save("")
+if PLOT:
+    plt.figure(figsize=(12, 8))
+
+    plt.subplot(2, 1, 1)
+    plt.plot(t, signal, label='Original Signal', alpha=0.7)
+    plt.plot(t, float_filtered, label='Float Filter', color='red', linewidth=2)
+    plt.plot(t, fixed_filtered, label='Fixed-Point Filter', color='green', linestyle='--', linewidth=2)
+    plt.title('Comparison: Floating-Point vs Fixed-Point Filter')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Amplitude')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(2, 1, 2)
+    plt.plot(t, error)
+    plt.title('Error between Float and Fixed-Point Filters')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Error')
+    plt.grid(True)
+
+    plt.tight_layout()
+    # plt.show()
+    # plt.save("")
 
 print(f"Maximum error between float and fixed-point filters: {np.max(np.abs(error)):.2e}")
 print(f"RMS error: {np.sqrt(np.mean(error**2)):.2e}")
@@ -94,49 +106,51 @@ print(f"Signal length: {len(signal)}")
 # First, scale and offset the signal to fit in ADC range
 signal_scaled = signal * 0.6  # Scale down to prevent clipping
 signal_offset = 1.65  # Add DC offset (middle of 3.3V range)
+signal_biased = signal_scaled + signal_offset
 
 adc_signal, info = simulate_8bit_adc(signal_scaled)
 adc_codes = adc_signal
 
 print(f"\nAfter scaling and offset for 8-bit ADC:")
-print(f"Scaled signal range: {np.min(signal_scaled + signal_offset):.3f} to {np.max(signal_scaled + signal_offset):.3f}")
+print(f"Scaled signal range: {np.min(signal_biased):.3f} to {np.max(signal_biased):.3f}")
 print(f"ADC codes range: {np.min(adc_codes)} to {np.max(adc_codes)}")
 print(f"Quantized signal range: {np.min(adc_signal):.3f}V to {np.max(adc_signal):.3f}V")
 
 # Plot comparison
-plt.figure(figsize=(14, 10))
-
-plt.subplot(3, 1, 1)
-plt.plot(t, signal, label='Original Signal', alpha=0.7)
-plt.plot(t, signal_scaled + signal_offset, label='Scaled + Offset Signal', alpha=0.7)
-plt.title('Original vs Scaled Signal for ADC')
-plt.xlabel('Time (s)')
-plt.ylabel('Amplitude (V)')
-plt.legend()
-plt.grid(True)
-
-plt.subplot(3, 1, 2)
-plt.plot(t, adc_codes, label='8-bit ADC Codes', color='red', linewidth=1)
-plt.title('8-bit ADC Output Codes (0-255)')
-plt.xlabel('Time (s)')
-plt.ylabel('ADC Code')
-plt.legend()
-plt.grid(True)
-
-plt.subplot(3, 1, 3)
-plt.plot(t, signal_scaled + signal_offset, label='Analog Signal', alpha=0.7)
-plt.plot(t, adc_signal, label='Quantized Signal', color='green', linewidth=1.5)
-plt.title('Analog vs Quantized Signal')
-plt.xlabel('Time (s)')
-plt.ylabel('Voltage (V)')
-plt.legend()
-plt.grid(True)
-
-plt.tight_layout()
-# plt.show()
+if PLOT:
+    plt.figure(figsize=(14, 10))
+
+    plt.subplot(3, 1, 1)
+    plt.plot(t, signal, label='Original Signal', alpha=0.7)
+    plt.plot(t, signal_biased, label='Scaled + Offset Signal', alpha=0.7)
+    plt.title('Original vs Scaled Signal for ADC')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Amplitude (V)')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(3, 1, 2)
+    plt.plot(t, adc_codes, label='8-bit ADC Codes', color='red', linewidth=1)
+    plt.title('8-bit ADC Output Codes (0-255)')
+    plt.xlabel('Time (s)')
+    plt.ylabel('ADC Code')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(3, 1, 3)
+    plt.plot(t, signal_biased, label='Analog Signal', alpha=0.7)
+    plt.plot(t, adc_signal, label='Quantized Signal', color='green', linewidth=1.5)
+    plt.title('Analog vs Quantized Signal')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Voltage (V)')
+    plt.legend()
+    plt.grid(True)
+
+    plt.tight_layout()
+    # plt.show()
 
 # Calculate quantization noise
-quantization_error = (signal_scaled + signal_offset) - adc_signal
+quantization_error = signal_biased - adc_signal
 print(f"\nQuantization characteristics:")
 print(f"Quantization step size: {3.3/255:.4f}V")
 print(f"Max quantization error: {np.max(np.abs(quantization_error)):.4f}V")
@@ -153,52 +167,57 @@ filtered_adc_codes = filtered_adc_voltage
 float_filtered_adc = apply_fir_filter(adc_signal, fir_coefficients)
 
 # Compare results
-plt.figure(figsize=(15, 12))
-
-plt.subplot(4, 1, 1)
-plt.plot(t, adc_codes, label='Original ADC Codes', alpha=0.7, linewidth=1)
-plt.plot(t, filtered_adc_codes, label='Filtered ADC Codes', color='red', linewidth=2)
-plt.title('8-bit ADC Codes: Original vs Filtered')
-plt.xlabel('Time (s)')
-plt.ylabel('ADC Code (0-255)')
-plt.legend()
-plt.grid(True)
-
-plt.subplot(4, 1, 2)
-plt.plot(t, adc_signal, label='Original Quantized Signal', alpha=0.7)
-plt.plot(t, float_filtered_adc, label='Float Filter', color='red', linewidth=2)
-plt.plot(t, filtered_adc_voltage, label='Fixed-Point Filter (8-bit ADC)', color='green', linestyle='--', linewidth=2)
-plt.title('Voltage Comparison: Float vs Fixed-Point Filter (8-bit ADC)')
-plt.xlabel('Time (s)')
-plt.ylabel('Voltage (V)')
-plt.legend()
-plt.grid(True)
-
-plt.subplot(4, 1, 3)
 adc_error = float_filtered_adc - filtered_adc_voltage
-plt.plot(t, adc_error)
-plt.title('Error between Float and Fixed-Point Filters (8-bit ADC)')
-plt.xlabel('Time (s)')
-plt.ylabel('Voltage Error (V)')
-plt.grid(True)
-
-plt.subplot(4, 1, 4)
-# Show frequency response by plotting power spectral density
-from scipy import signal as scipy_signal
-f_orig, psd_orig = scipy_signal.welch(adc_signal, sample_rate, nperseg=256)
-f_filt, psd_filt = scipy_signal.welch(filtered_adc_voltage, sample_rate, nperseg=min(256, len(filtered_adc_voltage)))
-
-plt.loglog(f_orig, psd_orig, label='Original ADC Signal', alpha=0.7)
-plt.loglog(f_filt, psd_filt, label='Filtered Signal', color='red', linewidth=2)
-plt.axvline(cutoff_freq, color='black', linestyle='--', label=f'Cutoff: {cutoff_freq} Hz')
-plt.title('Power Spectral Density')
-plt.xlabel('Frequency (Hz)')
-plt.ylabel('PSD (V²/Hz)')
-plt.legend()
-plt.grid(True)
-
-plt.tight_layout()
-plt.show()
+
+if PLOT:
+    plt.figure(figsize=(15, 12))
+
+    plt.subplot(4, 1, 1)
+    plt.plot(t, adc_codes, label='Original ADC Codes', alpha=0.7, linewidth=1)
+    plt.plot(t, filtered_adc_codes, label='Filtered ADC Codes', color='red', linewidth=2)
+    plt.title('8-bit ADC Codes: Original vs Filtered')
+    plt.xlabel('Time (s)')
+    plt.ylabel('ADC Code (0-255)')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(4, 1, 2)
+    plt.plot(t, adc_signal, label='Original Quantized Signal', alpha=0.7)
+    plt.plot(t, float_filtered_adc, label='Float Filter', color='red', linewidth=2)
+    plt.plot(t, filtered_adc_voltage, label='Fixed-Point Filter (8-bit ADC)', color='green', linestyle='--', linewidth=2)
+    plt.title('Voltage Comparison: Float vs Fixed-Point Filter (8-bit ADC)')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Voltage (V)')
+    plt.legend()
+    plt.grid(True)
+
+    plt.subplot(4, 1, 3)
+    plt.plot(t, adc_error)
+    plt.title('Error between Float and Fixed-Point Filters (8-bit ADC)')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Voltage Error (V)')
+    plt.grid(True)
+
+    plt.subplot(4, 1, 4)
+    # Show frequency response by plotting power spectral density
+    from scipy import signal as scipy_signal
+    # Both PSDs use the same segment length, so build the Hann window once
+    nperseg = min(256, len(filtered_adc_voltage))
+    psd_window = scipy_signal.get_window('hann', nperseg)
+    f_orig, psd_orig = scipy_signal.welch(adc_signal, sample_rate, window=psd_window, nperseg=nperseg)
+    f_filt, psd_filt = scipy_signal.welch(filtered_adc_voltage, sample_rate, window=psd_window, nperseg=nperseg)
+
+    plt.loglog(f_orig, psd_orig, label='Original ADC Signal', alpha=0.7)
+    plt.loglog(f_filt, psd_filt, label='Filtered Signal', color='red', linewidth=2)
+    plt.axvline(cutoff_freq, color='black', linestyle='--', label=f'Cutoff: {cutoff_freq} Hz')
+    plt.title('Power Spectral Density')
+    plt.xlabel('Frequency (Hz)')
+    plt.ylabel('PSD (V²/Hz)')
+    plt.legend()
+    plt.grid(True)
+
+    plt.tight_layout()
+    plt.show()
 
 print(f"8-bit ADC Filter Results:")
 print(f"Maximum error between float and fixed-point filters: {np.max(np.abs(adc_error)):.4f}V")
@@ -7,8 +7,11 @@ commonly found in FPGA designs, including quantization effects and DC bias.
 
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy.signal import lfilter
 from typing import Tuple, Optional, Union
 
+from .random_source import DEFAULT_GENERATOR
+
 
 def simulate_8bit_adc(
     signal: np.ndarray,
@@ -16,7 +19,10 @@ def simulate_8bit_adc(
     dc_bias: float = 1.25,
     bits: int = 8,
     add_noise: bool = False,
-    noise_std: float = 0.001
+    noise_std: float = 0.001,
+    dtype: Optional[np.dtype] = None,
+    rng: Optional[np.random.Generator] = None,
+    out_dtype: Optional[np.dtype] = None
 ) -> Tuple[np.ndarray, dict]:
     """
     Simulate an 8-bit ADC with DC bias for unipolar operation.
@@ -35,12 +41,27 @@ def simulate_8bit_adc(
         Whether to add ADC noise
     noise_std : float, optional
         Standard deviation of ADC noise
+    dtype : np.dtype, optional
+        Floating-point type of the working buffer and returned signal. By
+        default the input's floating type is kept (float64 for integer input).
+        np.float32 halves memory traffic and is ample for ADCs up to ~20 bits,
+        but samples within float32 rounding of a code edge may change code.
+    rng : np.random.Generator, optional
+        Random generator for ADC noise. Defaults to the toolkit's shared
+        generator, which np.random.seed() does not affect; pass
+        np.random.default_rng(seed) for reproducible runs
+    out_dtype : np.dtype, optional
+        If given (e.g. np.uint8), return the raw ADC output codes in this
+        integer type instead of bias-removed voltages. It must hold every
+        code (2**bits - 1) and cannot be combined with add_noise, which is
+        applied to the output voltages
         
     Returns:
     --------
     tuple
         (digitized_signal, adc_info)
         - digitized_signal: Signal after ADC processing and bias removal
+          (or raw ADC codes when out_dtype is given)
         - adc_info: Dictionary with ADC performance metrics
         
     Examples:
@@ -50,37 +71,56 @@ def simulate_8bit_adc(
     >>> digital, info = simulate_8bit_adc(signal)
     >>> print(f"ADC SNR: {info['snr_db']:.1f} dB")
     """
-    # Add DC bias to make signal unipolar
-    biased_signal = signal + dc_bias
-    
-    # Clip to ADC input range
     adc_min, adc_max = adc_range
-    clipped_signal = np.clip(biased_signal, adc_min, adc_max)
-    
-    # Track clipping
-    clipped_samples = np.sum((biased_signal < adc_min) | (biased_signal > adc_max))
+    adc_span = adc_max - adc_min
     
     # Quantization
     num_levels = 2 ** bits
-    lsb = (adc_max - adc_min) / num_levels
     
-    # Normalize to 0-1 range
-    normalized = (clipped_signal - adc_min) / (adc_max - adc_min)
+    if out_dtype is not None:
+        if add_noise:
+            raise ValueError("add_noise is applied to output voltages and cannot be combined with out_dtype")
+        if np.iinfo(out_dtype).max < num_levels - 1:
+            raise ValueError(f"out_dtype {np.dtype(out_dtype)} cannot hold {bits}-bit ADC codes")
+    lsb = adc_span / num_levels
     
-    # Quantize
-    quantized_levels = np.floor(normalized * num_levels)
-    # Avoid overflow on maximum value
-    quantized_levels = np.clip(quantized_levels, 0, num_levels - 1)
+    # Add DC bias to make the signal unipolar. This is the only full-size
+    # allocation; every later stage works in place on this buffer, in the
+    # same order as the step-by-step model so code boundaries round alike.
+    buf = np.array(signal, dtype=np.result_type(signal, 1.0) if dtype is None else dtype)
+    buf += dc_bias
     
-    # Convert back to voltage
-    quantized_voltage = (quantized_levels / num_levels) * (adc_max - adc_min) + adc_min
+    # Track clipping
+    clipped_samples = np.sum((buf < adc_min) | (buf > adc_max))
+    
+    # Clip to ADC input range and normalize to 0-num_levels. The upper clip
+    # sits half an LSB below full scale: everything in the top half-LSB lands
+    # in the top code anyway, and this keeps the scaled value strictly below
+    # num_levels so no separate overflow clamp is needed.
+    np.clip(buf, adc_min, adc_max - 0.5 * lsb, out=buf)
+    buf -= adc_min
+    buf /= adc_span
+    buf *= num_levels
+    
+    # Quantize. The buffer is non-negative here, so truncating to an
+    # unsigned integer is the same as floor; the narrowest type that holds
+    # num_levels keeps the level array small.
+    quantized_levels = buf.astype(np.min_scalar_type(num_levels - 1))
+    quantized_levels_range = (int(np.min(quantized_levels)), int(np.max(quantized_levels)))
+    
+    # Convert back to voltage (lsb is exact since num_levels is a power of two)
+    np.multiply(quantized_levels, lsb, out=buf)
+    buf += adc_min
     
     # Add ADC noise if requested
     if add_noise:
-        quantized_voltage += np.random.normal(0, noise_std, len(quantized_voltage))
+        noise = (DEFAULT_GENERATOR if rng is None else rng).standard_normal(len(buf))
+        noise *= noise_std
+        buf += noise
     
-    # Remove DC bias digitally  
-    digitized_signal = quantized_voltage - dc_bias
+    # Remove DC bias digitally
+    buf -= dc_bias
+    digitized_signal = buf
     
     # Calculate performance metrics
     original_power = np.var(signal)
@@ -91,7 +131,8 @@ def simulate_8bit_adc(
     enob = (snr_db - 1.76) / 6.02  # Effective Number of Bits
     
     # Calculate utilization
-    utilized_levels = np.max(quantized_levels) - np.min(quantized_levels) + 1
+    signal_range = (np.min(signal), np.max(signal))
+    utilized_levels = quantized_levels_range[1] - quantized_levels_range[0] + 1
     utilization = utilized_levels / num_levels
     
     adc_info = {
@@ -106,11 +147,15 @@ def simulate_8bit_adc(
         'clipping_rate': clipped_samples / len(signal),
         'snr_db': snr_db,
         'enob': enob,
-        'signal_range': (np.min(signal), np.max(signal)),
-        'biased_range': (np.min(biased_signal), np.max(biased_signal)),
-        'quantized_levels_range': (np.min(quantized_levels), np.max(quantized_levels))
+        'signal_range': signal_range,
+        # Adding a scalar is monotonic, so the biased extremes follow directly
+        'biased_range': (signal_range[0] + dc_bias, signal_range[1] + dc_bias),
+        'quantized_levels_range': quantized_levels_range
     }
     
+    if out_dtype is not None:
+        return quantized_levels.astype(out_dtype, copy=False), adc_info
+    
     return digitized_signal, adc_info
 
 
@@ -251,23 +296,28 @@ def simulate_adc_dac_with_dc_removal(
     # Step 2: Digital DC removal using simple high-pass filter
     # Simple first-order IIR high-pass filter: y[n] = a*y[n-1] + (1-a)*(x[n] - x[n-1])
     alpha = 1 - 2 * np.pi * hpf_cutoff
-    dc_removed = np.zeros_like(adc_output)
-    
-    for n in range(1, len(adc_output)):
-        dc_removed[n] = alpha * dc_removed[n-1] + (adc_output[n] - adc_output[n-1])
+    dc_removed = _dc_removal_hpf(adc_output, alpha)
     
     # Step 3: DAC simulation
     dac_min, dac_max = dac_range
     dac_levels = 2 ** dac_bits
-    dac_lsb = (dac_max - dac_min) / dac_levels
+    dac_span = dac_max - dac_min
+    dac_lsb = dac_span / dac_levels
     
-    # Clip to DAC range
-    clipped_for_dac = np.clip(dc_removed, dac_min, dac_max)
+    # Scale factors between volts and DAC codes, computed once so the
+    # per-sample work is multiplies rather than divides
+    dac_codes_per_volt = (dac_levels - 1) / dac_span
+    dac_volts_per_code = dac_span / (dac_levels - 1)
+    
+    # Clip to DAC range (single output buffer, quantized in place below)
+    dac_output = np.clip(dc_removed, dac_min, dac_max)
     
     # Quantize for DAC
-    normalized_dac = (clipped_for_dac - dac_min) / (dac_max - dac_min)
-    quantized_dac_levels = np.round(normalized_dac * (dac_levels - 1))
-    dac_output = (quantized_dac_levels / (dac_levels - 1)) * (dac_max - dac_min) + dac_min
+    dac_output -= dac_min
+    dac_output *= dac_codes_per_volt
+    np.round(dac_output, out=dac_output)
+    dac_output *= dac_volts_per_code
+    dac_output += dac_min
     
     # Calculate chain performance metrics
     total_error = signal - dac_output
@@ -307,6 +357,17 @@ def simulate_adc_dac_with_dc_removal(
     return dac_output, processing_chain_info
 
 
+def _dc_removal_hpf(x: np.ndarray, alpha: float) -> np.ndarray:
+    """First-order DC-blocking filter y[n] = alpha*y[n-1] + x[n] - x[n-1], with y[0] = 0."""
+    if len(x) == 0:
+        return np.zeros_like(x, dtype=np.float64)
+    
+    # Initial state -x[0] keeps the first output at zero (no step on startup)
+    y: np.ndarray
+    y, _ = lfilter([1.0, -1.0], [1.0, -alpha], x, zi=[-x[0]])
+    return y
+
+
 def plot_adc_characteristics(
     adc_info: dict,
     signal_before: Optional[np.ndarray] = None,
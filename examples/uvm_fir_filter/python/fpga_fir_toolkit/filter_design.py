@@ -7,8 +7,23 @@ window functions and plotting their frequency responses.
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.signal import freqz
-from typing import Tuple, Optional, Union
+from functools import lru_cache
+from scipy.signal import freqz, lfilter, oaconvolve
+from typing import Callable, Dict, Tuple, Optional, Union
+
+
+# Filter length at which FFT-based (overlap-add) convolution beats the
+# direct O(N*M) kernels of np.convolve / lfilter (measured crossover ~100-128)
+_FFT_CONVOLVE_MIN_TAPS = 128
+
+# Window functions supported by design_fir_lowpass
+_WINDOW_FUNCTIONS: Dict[str, Callable[[int], np.ndarray]] = {
+    'hamming': np.hamming,
+    'hanning': np.hanning,
+    'blackman': np.blackman,
+    'bartlett': np.bartlett,
+    'rectangular': np.ones
+}
 
 
 def design_fir_lowpass(
@@ -16,7 +31,8 @@ def design_fir_lowpass(
     sampling_rate: float, 
     num_taps: int,
     window: str = 'hamming',
-    normalize_dc: bool = True
+    normalize_dc: bool = True,
+    dtype: Optional[np.dtype] = None
 ) -> np.ndarray:
     """
     Design a lowpass FIR filter using the windowed sinc method.
@@ -33,6 +49,10 @@ def design_fir_lowpass(
         Window function ('hamming', 'hanning', 'blackman', 'bartlett', 'rectangular')
     normalize_dc : bool, optional
         Whether to normalize DC gain to 1.0
+    dtype : np.dtype, optional
+        Floating-point type of the returned coefficients (float64 if None).
+        The design itself is always computed in float64; np.float32 still
+        resolves Q1.15 taps exactly.
         
     Returns:
     --------
@@ -44,59 +64,95 @@ def design_fir_lowpass(
     >>> h = design_fir_lowpass(1000, 8000, 31)
     >>> print(f"Designed {len(h)} tap lowpass filter")
     """
+    # Designs are deterministic, so repeated requests (e.g. parameter sweeps
+    # or re-running a script) are served from a cache. astype always copies,
+    # which keeps the cached array safe from callers that modify their
+    # coefficients in place.
+    return _design_fir_lowpass_cached(
+        cutoff_freq, sampling_rate, num_taps, window, normalize_dc
+    ).astype(np.float64 if dtype is None else dtype)
+
+
+@lru_cache(maxsize=32)
+def _design_fir_lowpass_cached(cutoff_freq: float, sampling_rate: float, num_taps: int,
+                               window: str, normalize_dc: bool) -> np.ndarray:
+    """Windowed-sinc lowpass design behind design_fir_lowpass; returns a read-only array."""
     # Normalize cutoff frequency (0 to 1, where 1 is Nyquist)
     normalized_cutoff = cutoff_freq / (sampling_rate / 2)
     
-    # Create time indices centered around 0
-    n = np.arange(num_taps)
-    n_center = (num_taps - 1) / 2
-    
-    # Generate ideal sinc response
-    h_ideal = np.sinc(normalized_cutoff * (n - n_center))
-    
-    # Apply window function
-    if window.lower() == 'hamming':
-        w = np.hamming(num_taps)
-    elif window.lower() == 'hanning':
-        w = np.hanning(num_taps)
-    elif window.lower() == 'blackman':
-        w = np.blackman(num_taps)
-    elif window.lower() == 'bartlett':
-        w = np.bartlett(num_taps)
-    elif window.lower() == 'rectangular':
-        w = np.ones(num_taps)
-    else:
+    # Select window function
+    if window.lower() not in _WINDOW_FUNCTIONS:
         raise ValueError(f"Unknown window type: {window}")
+    w = _get_window(window.lower(), num_taps)
+    
+    # Create time indices centered around 0
+    n = np.arange(num_taps, dtype=np.float64)
+    n -= (num_taps - 1) / 2
+    n *= normalized_cutoff
     
-    # Apply window
-    h = h_ideal * w
+    # Generate ideal sinc response, then window and normalize it in place
+    h = np.sinc(n)
+    h *= w
     
     # Normalize DC gain to 1.0 if requested
     if normalize_dc:
         dc_gain = np.sum(h)
         if dc_gain != 0:
-            h = h / dc_gain
+            h /= dc_gain
     
+    h.setflags(write=False)
     return h
 
 
-def apply_fir_filter(signal: np.ndarray, coefficients: np.ndarray, mode: str = 'causal') -> np.ndarray:
+@lru_cache(maxsize=64)
+def _get_window(window: str, num_taps: int) -> np.ndarray:
+    """Window of the given type and length, shared across designs (read-only)."""
+    w = np.asarray(_WINDOW_FUNCTIONS[window](num_taps))
+    w.setflags(write=False)
+    return w
+
+
+def _get_freqz(coefficients: np.ndarray, worN: int = 8000) -> Tuple[np.ndarray, np.ndarray]:
+    """freqz of an FIR filter, shared between plotting and analysis (read-only arrays)."""
+    coefficients = np.ascontiguousarray(coefficients, dtype=np.float64)
+    return _freqz_cached(coefficients.tobytes(), worN)
+
+
+@lru_cache(maxsize=8)
+def _freqz_cached(coeffs_bytes: bytes, worN: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Frequency response for coefficients serialized by _get_freqz."""
+    w, h = freqz(np.frombuffer(coeffs_bytes, dtype=np.float64), worN=worN)
+    w.setflags(write=False)
+    h.setflags(write=False)
+    return w, h
+
+
+def apply_fir_filter(
+    signal: np.ndarray,
+    coefficients: np.ndarray,
+    mode: str = 'causal',
+    dtype: Optional[np.dtype] = None
+) -> np.ndarray:
     """
     Apply FIR filter to a signal using convolution.
     
     Parameters:
     -----------
     signal : np.ndarray
-        Input signal to filter
+        Input signal to filter. Multi-dimensional arrays (e.g. stacked I/Q
+        channels) are filtered along the last axis in a single call.
     coefficients : np.ndarray
         FIR filter coefficients
     mode : str, optional
         Convolution mode: 'same' (centered, non-causal) or 'causal' (FPGA-realistic)
+    dtype : np.dtype, optional
+        Floating-point type to filter in (e.g. np.float32). By default the
+        signal and coefficients are used as given.
         
     Returns:
     --------
     np.ndarray
-        Filtered signal (same length as input)
+        Filtered signal (same shape as input)
         
     Examples:
     ---------
@@ -105,20 +161,27 @@ def apply_fir_filter(signal: np.ndarray, coefficients: np.ndarray, mode: str = '
     >>> filtered = apply_fir_filter(signal, h, mode='causal')  # FPGA-realistic
     >>> filtered_centered = apply_fir_filter(signal, h, mode='same')  # Centered
     """
+    signal = np.asarray(signal, dtype=dtype)
+    if dtype is not None:
+        coefficients = np.asarray(coefficients, dtype=dtype)
+    # Coefficients broadcast along the last (time) axis for oaconvolve
+    kernel = np.reshape(coefficients, (1,) * (signal.ndim - 1) + (-1,))
+    
     if mode == 'causal':
-        # Causal FIR filter - only uses past and current samples (FPGA-realistic)
-        N = len(signal)
-        M = len(coefficients)
-        filtered = np.zeros(N)
-        
-        for n in range(N):
-            for k in range(M):
-                if (n - k) >= 0:
-                    filtered[n] += signal[n - k] * coefficients[k]
-        
+        # Causal FIR filter - only uses past and current samples (FPGA-realistic).
+        # Direct-form FIR with zero initial state: y[n] = sum_k h[k] * x[n-k],
+        # i.e. the first N samples of the full convolution
+        filtered: np.ndarray
+        if len(coefficients) >= _FFT_CONVOLVE_MIN_TAPS:
+            filtered = oaconvolve(signal, kernel, mode='full', axes=-1)[..., :signal.shape[-1]]
+        else:
+            filtered = lfilter(coefficients, np.ones(1, dtype=dtype), signal)
         return filtered
     else:
         # Use 'same' mode to return same length as input (centered, non-causal)
+        if signal.ndim > 1 or len(coefficients) >= _FFT_CONVOLVE_MIN_TAPS:
+            centered: np.ndarray = oaconvolve(signal, kernel, mode='same', axes=-1)
+            return centered
         return np.convolve(signal, coefficients, mode='same')
 
 
@@ -156,7 +219,7 @@ def plot_filter_response(
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
     
     # Frequency response
-    w, h = freqz(coefficients, worN=8000)
+    w, h = _get_freqz(coefficients, worN=8000)
     frequencies = w * sampling_rate / (2 * np.pi)
     
     ax1.plot(frequencies, 20 * np.log10(np.abs(h)))
@@ -202,7 +265,7 @@ def analyze_filter_performance(
     dict
         Performance metrics including passband ripple, stopband attenuation, etc.
     """
-    w, h = freqz(coefficients, worN=8000)
+    w, h = _get_freqz(coefficients, worN=8000)
     frequencies = w * sampling_rate / (2 * np.pi)
     magnitude_db = 20 * np.log10(np.abs(h))
     
@@ -210,11 +273,12 @@ def analyze_filter_performance(
     dc_gain_db = magnitude_db[0]
     
     # Find -3dB point
-    three_db_idx = np.argmin(np.abs(magnitude_db - (dc_gain_db - 3)))
+    level_error = magnitude_db - (dc_gain_db - 3)
+    three_db_idx = np.argmin(np.abs(level_error, out=level_error))
     actual_3db_freq = frequencies[three_db_idx]
     
     # Passband ripple (up to cutoff frequency)
-    cutoff_idx = np.argmin(np.abs(frequencies - cutoff_freq))
+    cutoff_idx = _nearest_index(frequencies, cutoff_freq)
     passband_mag = magnitude_db[:cutoff_idx]
     passband_ripple = np.max(passband_mag) - np.min(passband_mag)
     
@@ -229,8 +293,16 @@ def analyze_filter_performance(
     
     # Stopband attenuation if stopband frequency provided
     if stopband_freq:
-        stopband_idx = np.argmin(np.abs(frequencies - stopband_freq))
+        stopband_idx = _nearest_index(frequencies, stopband_freq)
         if stopband_idx < len(magnitude_db):
             metrics['stopband_attenuation_db'] = dc_gain_db - magnitude_db[stopband_idx]
             
-    return metrics
\ No newline at end of file
+    return metrics
+
+
+def _nearest_index(sorted_values: np.ndarray, value: float) -> int:
+    """Index of the entry closest to value in an ascending array (first on ties)."""
+    idx = int(np.searchsorted(sorted_values, value))
+    if idx == len(sorted_values) or (idx > 0 and value - sorted_values[idx - 1] <= sorted_values[idx] - value):
+        idx -= 1
+    return idx
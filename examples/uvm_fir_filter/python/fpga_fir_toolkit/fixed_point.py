@@ -6,13 +6,15 @@ representation and implements fixed-point filtering for FPGA simulation.
 """
 
 import numpy as np
-from typing import Tuple, Union, Optional
+from typing import Dict, Tuple, Union, Optional
 
 
 def float_to_fixed_point(
     coeffs: np.ndarray, 
     int_bits: int = 1, 
-    frac_bits: int = 15
+    frac_bits: int = 15,
+    dtype: Optional[np.dtype] = None,
+    bit_compress: bool = False
 ) -> Tuple[np.ndarray, dict]:
     """
     Convert floating-point FIR coefficients to fixed-point representation.
@@ -32,6 +34,16 @@ def float_to_fixed_point(
         Number of integer bits (default 1 for Q1.15)
     frac_bits : int, optional  
         Number of fractional bits (default 15 for Q1.15)
+    dtype : np.dtype, optional
+        Floating-point type of the working buffer and reconstructed
+        coefficients (float64 if None). np.float32 is sufficient for formats
+        up to ~16 bits; wider formats need float64 to round correctly.
+    bit_compress : bool, optional
+        Apply Shen's bit compression: shift each coefficient left until its
+        redundant sign bits are gone, so small taps keep full precision. The
+        per-tap shifts are returned in conversion_info['shifts']; hardware
+        shifts each product right by that amount before accumulating (pass
+        them as coeff_shifts to the apply_fixed_point_filter* simulators).
         
     Returns:
     --------
@@ -47,6 +59,8 @@ def float_to_fixed_point(
     >>> print(f"Scale factor: {info['scale_factor']}")
     """
     total_bits = int_bits + frac_bits
+    if dtype is None:
+        dtype = np.dtype(np.float64)
     
     # Calculate scale factor for fractional bits
     scale_factor = 2 ** frac_bits
@@ -55,21 +69,40 @@ def float_to_fixed_point(
     max_val = 2**(total_bits-1) - 1  # For signed representation
     min_val = -2**(total_bits-1)
     
-    # Scale coefficients
-    scaled_coeffs = coeffs * scale_factor
+    # Scale coefficients (single working buffer, reused below)
+    scaled_coeffs = np.multiply(coeffs, scale_factor, dtype=dtype)
     
     # Check for overflow
-    overflow_indices = np.where((scaled_coeffs > max_val) | (scaled_coeffs < min_val))[0]
+    overflow_indices = np.flatnonzero((scaled_coeffs > max_val) | (scaled_coeffs < min_val))
+    
+    # Bit compression: largest left shift that keeps each tap within range,
+    # capped at total_bits-1 so the shift amounts fit a small RTL shifter
+    shifts = np.zeros(len(scaled_coeffs), dtype=np.int32)
+    if bit_compress:
+        # Zero taps have nothing to compress, and a 1-bit format (max_val == 0)
+        # has no headroom, so only the remaining taps are divided
+        magnitude = np.abs(scaled_coeffs)
+        compressible = (magnitude > 0) & (max_val > 0)
+        headroom = np.zeros(len(magnitude))
+        np.divide(max_val, magnitude, out=headroom, where=compressible, dtype=np.float64)
+        np.log2(headroom, out=headroom, where=compressible)
+        np.floor(headroom, out=headroom)
+        np.copyto(shifts, np.minimum(headroom, total_bits - 1),
+                  where=headroom > 0, casting='unsafe')
+        scaled_coeffs *= np.ldexp(1.0, shifts)
     
     # Saturate overflowed values
-    saturated_coeffs = np.clip(scaled_coeffs, min_val, max_val)
+    np.clip(scaled_coeffs, min_val, max_val, out=scaled_coeffs)
     
     # Convert to integers
-    fixed_point_coeffs = np.round(saturated_coeffs).astype(np.int32)
+    fixed_point_coeffs = np.rint(scaled_coeffs).astype(np.int32)
     
-    # Calculate quantization error
-    reconstructed = fixed_point_coeffs.astype(np.float64) / scale_factor
-    quantization_error = np.abs(coeffs - reconstructed)
+    # Calculate quantization error (1/scale_factor is exact for a power of two)
+    reconstructed = np.multiply(fixed_point_coeffs, 1.0 / scale_factor, dtype=dtype)
+    if bit_compress:
+        reconstructed = np.ldexp(reconstructed, -shifts)
+    quantization_error = np.subtract(coeffs, reconstructed, out=scaled_coeffs)
+    np.abs(quantization_error, out=quantization_error)
     
     conversion_info = {
         'int_bits': int_bits,
@@ -80,6 +113,8 @@ def float_to_fixed_point(
         'min_representable': min_val / scale_factor,
         'overflow_count': len(overflow_indices),
         'overflow_indices': overflow_indices,
+        'bit_compress': bit_compress,
+        'shifts': shifts,
         'max_quantization_error': np.max(quantization_error),
         'mean_quantization_error': np.mean(quantization_error),
         'original_coeffs': coeffs,
@@ -95,7 +130,8 @@ def apply_fixed_point_filter(
     coeff_frac_bits: int = 15,
     accumulator_bits: int = 32,
     output_shift: int = 15,
-    input_scaling: float = 1.0
+    input_scaling: float = 1.0,
+    coeff_shifts: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, dict]:
     """
     Apply fixed-point FIR filter with realistic FPGA arithmetic.
@@ -117,6 +153,9 @@ def apply_fixed_point_filter(
         Right shift for output scaling
     input_scaling : float, optional
         Scale factor for input signal
+    coeff_shifts : np.ndarray, optional
+        Per-tap product right shifts of bit-compressed coefficients
+        (conversion_info['shifts'] from float_to_fixed_point)
         
     Returns:
     --------
@@ -131,39 +170,26 @@ def apply_fixed_point_filter(
     >>> filtered, info = apply_fixed_point_filter(signal, fixed_coeffs)
     """
     # Scale input signal to fixed-point range (assume 16-bit ADC)
-    input_scale = int(input_scaling * (2**15))
+    input_scale = int(input_scaling * (1 << 15))
     scaled_input = (signal * input_scale).astype(np.int32)
     
-    # Initialize output
     N = len(signal)
-    M = len(fixed_point_coeffs)
-    filtered_signal = np.zeros(N, dtype=np.float64)
     
     # Accumulator overflow tracking
-    accumulator_max = 2**(accumulator_bits-1) - 1
-    accumulator_min = -2**(accumulator_bits-1)
-    overflow_count = 0
-    
-    # Apply filter with fixed-point arithmetic
-    for n in range(N):
-        # Compute FIR output
-        # accumulator = 0
-        accumulator = np.int64(0)
-        
-        for k in range(M):
-            if (n - k) >= 0:
-                # Multiply and accumulate
-                product = scaled_input[n - k] * fixed_point_coeffs[k]
-                accumulator += product
-        
-        # Check for accumulator overflow
-        if accumulator > accumulator_max or accumulator < accumulator_min:
-            overflow_count += 1
-            accumulator = np.clip(accumulator, accumulator_min, accumulator_max)
-        
-        # Apply output shift and convert back to float
-        output_sample = accumulator >> output_shift
-        filtered_signal[n] = output_sample / (2**15)  # Scale back to normalized range
+    accumulator_max = (1 << (accumulator_bits-1)) - 1
+    accumulator_min = -(1 << (accumulator_bits-1))
+    
+    # Apply filter with fixed-point arithmetic (exact integer MACs)
+    accumulator = _integer_fir(scaled_input, fixed_point_coeffs, coeff_shifts=coeff_shifts)
+    
+    # Check for accumulator overflow and saturate
+    overflow_count = int(np.count_nonzero((accumulator > accumulator_max) | (accumulator < accumulator_min)))
+    np.clip(accumulator, accumulator_min, accumulator_max, out=accumulator)
+    
+    # Apply output shift in place and convert back to float; the scale is a
+    # power of two, so multiplying by its reciprocal is exact
+    accumulator >>= output_shift
+    filtered_signal = accumulator * (1.0 / (1 << 15))  # Scale back to normalized range
     
     simulation_info = {
         'input_scaling': input_scaling,
@@ -178,13 +204,34 @@ def apply_fixed_point_filter(
     return filtered_signal, simulation_info
 
 
+def _integer_fir(samples: np.ndarray, coeffs: np.ndarray, shift: int = 0,
+                 coeff_shifts: Optional[np.ndarray] = None) -> np.ndarray:
+    """FIR on integer data with exact int64 MACs; output n is sum_k h[k]*x[n+shift-k].
+
+    With coeff_shifts, each product h[k]*x is arithmetically shifted right by
+    coeff_shifts[k] before accumulation, as bit-compressed RTL does.
+    """
+    samples = samples.astype(np.int64)
+    if coeff_shifts is None or not np.any(coeff_shifts):
+        accumulator = np.convolve(samples, coeffs.astype(np.int64))
+    else:
+        # The per-product truncation does not distribute over a convolution,
+        # so accumulate one shifted product stream per tap
+        accumulator = np.zeros(len(samples) + len(coeffs) - 1, dtype=np.int64)
+        for k, (coeff, coeff_shift) in enumerate(zip(np.asarray(coeffs).tolist(),
+                                                     np.asarray(coeff_shifts).tolist())):
+            accumulator[k:k + len(samples)] += (samples * coeff) >> coeff_shift
+    return accumulator[shift:shift + len(samples)]
+
+
 def apply_fixed_point_filter_8bit_adc(
     signal: np.ndarray,
     fixed_point_coeffs: np.ndarray,
     adc_bits: int = 8,
     adc_range: Tuple[float, float] = (-1.0, 1.0),
     dc_bias: float = 1.25,
-    coeff_frac_bits: int = 15
+    coeff_frac_bits: int = 15,
+    coeff_shifts: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, dict]:
     """
     Apply fixed-point FIR filter with 8-bit ADC simulation.
@@ -195,7 +242,11 @@ def apply_fixed_point_filter_8bit_adc(
     Parameters:
     -----------
     signal : np.ndarray
-        Input analog signal 
+        Input analog signal, or raw unsigned ADC codes (e.g. uint8 from
+        simulate_8bit_adc(..., out_dtype=np.uint8)), which skip the ADC model.
+        Codes are mapped back to volts as simulate_8bit_adc does
+        (code * LSB + adc_range[0] - dc_bias, LSB = span / 2**adc_bits), so
+        both input kinds give outputs in volts
     fixed_point_coeffs : np.ndarray
         Fixed-point filter coefficients
     adc_bits : int, optional
@@ -206,6 +257,9 @@ def apply_fixed_point_filter_8bit_adc(
         DC bias voltage for unipolar ADC
     coeff_frac_bits : int, optional
         Fractional bits in coefficients
+    coeff_shifts : np.ndarray, optional
+        Per-tap product right shifts of bit-compressed coefficients
+        (conversion_info['shifts'] from float_to_fixed_point)
         
     Returns:
     --------
@@ -219,51 +273,69 @@ def apply_fixed_point_filter_8bit_adc(
     >>> coeffs, _ = float_to_fixed_point(design_fir_lowpass(50, 1000, 31))
     >>> filtered, info = apply_fixed_point_filter_8bit_adc(signal, coeffs)
     """
-    # Step 1: Add DC bias for unipolar ADC
-    biased_signal = signal + dc_bias
-    
-    # Step 2: ADC quantization
-    adc_levels = 2 ** adc_bits
+    adc_levels = 1 << adc_bits
     adc_min, adc_max = adc_range
-    
-    # Clip to ADC range
-    clipped_signal = np.clip(biased_signal, adc_min, adc_max)
-    
-    # Quantize
-    normalized = (clipped_signal - adc_min) / (adc_max - adc_min)
-    quantized_levels = np.round(normalized * (adc_levels - 1))
-    adc_output = quantized_levels / (adc_levels - 1) * (adc_max - adc_min) + adc_min
-    
-    # Step 3: Remove DC bias digitally
-    dc_removed = adc_output - dc_bias
+    input_scale = 1 << (adc_bits-1)  # Scale to use full ADC range
+    
+    signal = np.asarray(signal)
+    if np.issubdtype(signal.dtype, np.unsignedinteger):
+        # Raw ADC codes: no clipping or quantization left to model
+        code_min, code_max = int(np.min(signal)), int(np.max(signal))
+        if code_max >= adc_levels:
+            raise ValueError(f"ADC code {code_max} does not fit {adc_bits}-bit ADC "
+                             f"(max {adc_levels - 1})")
+        level_span = float(code_max - code_min)
+        clipping_samples = 0
+        snr_db = float('nan')  # No analog reference to compare against
+        
+        # Back to bias-removed volts (simulate_8bit_adc's code-to-voltage map)
+        lsb = (adc_max - adc_min) / adc_levels
+        offset = adc_min - dc_bias
+        buf = np.multiply(signal, lsb, dtype=np.float64)
+        buf += offset
+        signal_range = (code_min * lsb + offset, code_max * lsb + offset)
+    else:
+        # The whole chain runs in one working buffer, applying the same
+        # operations in the same order as a step-by-step model
+        
+        # Step 1: Add DC bias for unipolar ADC
+        buf = signal + dc_bias
+        clipping_samples = int(np.count_nonzero((buf < adc_min) | (buf > adc_max)))
+        
+        # Step 2: ADC quantization
+        # Clip to ADC range
+        np.clip(buf, adc_min, adc_max, out=buf)
+        
+        # Quantize
+        buf -= adc_min
+        buf /= adc_max - adc_min
+        buf *= adc_levels - 1
+        np.round(buf, out=buf)
+        level_span = float(np.max(buf) - np.min(buf))
+        buf /= adc_levels - 1
+        buf *= adc_max - adc_min
+        buf += adc_min
+        
+        # Step 3: Remove DC bias digitally
+        buf -= dc_bias
+        
+        # ADC metrics
+        quantization_noise_power = np.mean((signal - buf)**2)
+        snr_db = 10 * np.log10(np.var(signal) / quantization_noise_power) if quantization_noise_power > 0 else float('inf')
+        signal_range = (np.min(signal), np.max(signal))
     
     # Step 4: Convert to fixed-point for filtering
-    input_scale = 2**(adc_bits-1)  # Scale to use full ADC range
-    scaled_input = (dc_removed * input_scale).astype(np.int32)
+    buf *= input_scale
+    scaled_input = buf.astype(np.int32)
     
     # Step 5: Apply fixed-point FIR filter
-    N = len(scaled_input)
-    M = len(fixed_point_coeffs)
-    filtered_output = np.zeros(N, dtype=np.int64)
-    
     # Calculate shift for 'same' mode behavior to match np.convolve
-    shift = (M - 1) // 2
-    
-    for n in range(N):
-        accumulator = 0
-        for k in range(M):
-            sample_idx = n - k + shift
-            if 0 <= sample_idx < N:
-                accumulator += scaled_input[sample_idx] * fixed_point_coeffs[k]
-        filtered_output[n] = accumulator
+    shift = (len(fixed_point_coeffs) - 1) // 2
+    filtered_output = _integer_fir(scaled_input, fixed_point_coeffs, shift, coeff_shifts)
     
     # Step 6: Scale output back to floating-point
-    output_shift = coeff_frac_bits + np.log2(input_scale).astype(int)
-    final_output = filtered_output.astype(np.float64) / (2**output_shift)
-    
-    # Calculate metrics
-    quantization_noise_power = np.mean((signal - dc_removed)**2)
-    snr_db = 10 * np.log10(np.var(signal) / quantization_noise_power) if quantization_noise_power > 0 else float('inf')
+    output_shift = coeff_frac_bits + (input_scale.bit_length() - 1)
+    final_output = filtered_output * (1.0 / (1 << output_shift))
     
     processing_info = {
         'adc_bits': adc_bits,
@@ -273,9 +345,9 @@ def apply_fixed_point_filter_8bit_adc(
         'input_scaling': input_scale,
         'output_shift': output_shift,
         'estimated_snr_db': snr_db,
-        'clipping_samples': np.sum((biased_signal < adc_min) | (biased_signal > adc_max)),
-        'signal_range': (np.min(signal), np.max(signal)),
-        'adc_utilization': (np.max(quantized_levels) - np.min(quantized_levels)) / (adc_levels - 1)
+        'clipping_samples': clipping_samples,
+        'signal_range': signal_range,
+        'adc_utilization': level_span / (adc_levels - 1)
     }
     
     return final_output, processing_info
@@ -303,22 +375,37 @@ def analyze_fixed_point_precision(
     dict
         Analysis results for each bit width
     """
-    results = {}
-    
-    for total_bits in bit_widths:
-        frac_bits = total_bits - int_bits
-        if frac_bits <= 0:
-            continue
-            
-        fixed_coeffs, info = float_to_fixed_point(
-            float_coeffs, int_bits, frac_bits
-        )
-        
-        results[total_bits] = {
-            'max_error': info['max_quantization_error'],
-            'mean_error': info['mean_quantization_error'], 
-            'overflow_count': info['overflow_count'],
-            'snr_db': -20 * np.log10(info['mean_quantization_error']) if info['mean_quantization_error'] > 0 else float('inf')
+    results: Dict[int, dict] = {}
+    
+    total_bits = [bits for bits in bit_widths if bits - int_bits > 0]
+    if not total_bits:
+        return results
+    
+    # Quantize for every bit width at once: one row per width, broadcasting
+    # per-width scale and saturation limits (same math as float_to_fixed_point)
+    widths = np.array(total_bits)[:, np.newaxis]
+    scale_factors = np.ldexp(1.0, widths - int_bits)
+    max_vals = np.ldexp(1.0, widths - 1) - 1
+    min_vals = -np.ldexp(1.0, widths - 1)
+    
+    coeffs = np.asarray(float_coeffs, dtype=np.float64)
+    quantized = coeffs * scale_factors
+    overflow_counts = np.count_nonzero((quantized > max_vals) | (quantized < min_vals), axis=1)
+    np.clip(quantized, min_vals, max_vals, out=quantized)
+    np.rint(quantized, out=quantized)
+    quantized /= scale_factors
+    
+    # Quantization error per width
+    errors = np.abs(coeffs - quantized, out=quantized)
+    max_errors = errors.max(axis=1)
+    mean_errors = errors.mean(axis=1)
+    
+    for bits, max_error, mean_error, overflow_count in zip(total_bits, max_errors, mean_errors, overflow_counts):
+        results[bits] = {
+            'max_error': max_error,
+            'mean_error': mean_error, 
+            'overflow_count': int(overflow_count),
+            'snr_db': -20 * np.log10(mean_error) if mean_error > 0 else float('inf')
         }
     
     return results
\ No newline at end of file
@@ -9,6 +9,16 @@ import numpy as np
 import os
 from typing import List, Union, Tuple, Optional
 from pathlib import Path
+from datetime import date
+
+
+# Smallest C / NumPy signed integer type able to hold a given bit width
+_INT_TYPE_TABLE = [
+    (8, 'int8_t', np.int8),
+    (16, 'int16_t', np.int16),
+    (32, 'int32_t', np.int32),
+    (64, 'int64_t', np.int64),
+]
 
 
 def export_coefficients_for_hardware(
@@ -20,7 +30,8 @@ def export_coefficients_for_hardware(
     create_verilog: bool = True,
     create_c_header: bool = True,
     create_hex: bool = True,
-    create_binary: bool = True
+    create_binary: bool = True,
+    bit_compress: bool = False
 ) -> dict:
     """
     Export FIR filter coefficients in multiple hardware-friendly formats.
@@ -45,6 +56,15 @@ def export_coefficients_for_hardware(
         Generate hexadecimal text file
     create_binary : bool, optional
         Generate binary file
+    bit_compress : bool, optional
+        Bit-compress the coefficients (see float_to_fixed_point) and export
+        them at the fewest fractional bits whose maximum quantization error is
+        no worse than the requested format uncompressed, narrowing
+        COEFF_WIDTH. The per-tap right shifts the RTL must apply to each
+        product are emitted as COEFF_SHIFTS in the SystemVerilog package,
+        fir_coeff_shifts in the C header, and <project>_coeff_shifts.hex/.bin
+        alongside the hex and binary files. Simulate the result with
+        apply_fixed_point_filter(..., coeff_shifts=conversion_info['shifts']).
         
     Returns:
     --------
@@ -63,8 +83,11 @@ def export_coefficients_for_hardware(
     output_path.mkdir(parents=True, exist_ok=True)
     
     # Convert to fixed-point
-    from .fixed_point import float_to_fixed_point
-    fixed_coeffs, conversion_info = float_to_fixed_point(coefficients, int_bits, frac_bits)
+    if bit_compress:
+        fixed_coeffs, conversion_info = _narrowest_compressed_format(coefficients, int_bits, frac_bits)
+    else:
+        from .fixed_point import float_to_fixed_point
+        fixed_coeffs, conversion_info = float_to_fixed_point(coefficients, int_bits, frac_bits)
     
     created_files = []
     
@@ -85,12 +108,23 @@ def export_coefficients_for_hardware(
         hex_file = output_path / f"{project_name}_coeffs.hex"
         _create_hex_file(fixed_coeffs, hex_file, conversion_info)
         created_files.append(str(hex_file))
+        
+        if bit_compress:
+            shifts_hex_file = output_path / f"{project_name}_coeff_shifts.hex"
+            _create_shifts_hex_file(conversion_info['shifts'], shifts_hex_file)
+            created_files.append(str(shifts_hex_file))
     
     # 4. Binary file
     if create_binary:
         bin_file = output_path / f"{project_name}_coeffs.bin"
         _create_binary_file(fixed_coeffs, bin_file, conversion_info)
         created_files.append(str(bin_file))
+        
+        if bit_compress:
+            # One unsigned byte per tap (shifts never exceed COEFF_WIDTH-1)
+            shifts_bin_file = output_path / f"{project_name}_coeff_shifts.bin"
+            conversion_info['shifts'].astype(np.uint8).tofile(shifts_bin_file)
+            created_files.append(str(shifts_bin_file))
     
     # Create README with information
     readme_file = output_path / "README.txt"
@@ -106,103 +140,175 @@ def export_coefficients_for_hardware(
     }
 
 
+def _narrowest_compressed_format(coefficients: np.ndarray, int_bits: int,
+                                 frac_bits: int) -> Tuple[np.ndarray, dict]:
+    """Bit-compressed coefficients at the fewest fractional bits matching Q(int_bits).(frac_bits) accuracy."""
+    from .fixed_point import float_to_fixed_point
+    _, reference_info = float_to_fixed_point(coefficients, int_bits, frac_bits)
+    target_error = reference_info['max_quantization_error']
+    
+    # A compressed tap rounds on a grid at least as fine as the uncompressed
+    # one, so frac_bits itself always qualifies and the search terminates.
+    # Start at 2 total bits, the narrowest signed format that can hold a tap
+    for bits in range(min(max(0, 2 - int_bits), frac_bits), frac_bits + 1):
+        fixed_coeffs, conversion_info = float_to_fixed_point(coefficients, int_bits, bits, bit_compress=True)
+        if conversion_info['max_quantization_error'] <= target_error:
+            break
+    
+    conversion_info['requested_frac_bits'] = frac_bits
+    return fixed_coeffs, conversion_info
+
+
 def _create_systemverilog_file(fixed_coeffs: np.ndarray, file_path: Path, 
                              project_name: str, conversion_info: dict) -> None:
     """Create SystemVerilog parameter file with FIR coefficients."""
     total_bits = conversion_info['total_bits']
+    int_bits = conversion_info['int_bits']
+    frac_bits = conversion_info['frac_bits']
+    num_taps = len(fixed_coeffs)
+    
+    parts = [f"""// FIR Filter Coefficients for {project_name}
+// Generated automatically from Python design
+// Format: Q{int_bits}.{frac_bits}
+// Total bits: {total_bits}
+// Number of taps: {num_taps}
+
+package {project_name}_pkg;
+
+    // Filter parameters
+    parameter int NUM_TAPS = {num_taps};
+    parameter int COEFF_WIDTH = {total_bits};
+    parameter int INT_BITS = {int_bits};
+    parameter int FRAC_BITS = {frac_bits};
+
+    // Filter coefficients
+    parameter logic signed [COEFF_WIDTH-1:0] COEFFS [NUM_TAPS] = '{{
+"""]
+    
+    coeff_hex = _ints_to_hex_lines(fixed_coeffs, total_bits).splitlines()
+    recon_values = conversion_info['reconstructed_coeffs'].tolist()
+    
+    # Every entry but the last is followed by a comma (ahead of its comment)
+    commas = [","] * (num_taps - 1) + [""]
+    parts.extend(
+        f"        {total_bits}'h{digits}{comma}  // Tap {i}: {recon:.6f}\n"
+        for i, (digits, comma, recon) in enumerate(zip(coeff_hex, commas, recon_values))
+    )
     
-    with open(file_path, 'w') as f:
-        f.write(f"// FIR Filter Coefficients for {project_name}\n")
-        f.write(f"// Generated automatically from Python design\n")
-        f.write(f"// Format: Q{conversion_info['int_bits']}.{conversion_info['frac_bits']}\n")
-        f.write(f"// Total bits: {total_bits}\n")
-        f.write(f"// Number of taps: {len(fixed_coeffs)}\n\n")
-        
-        f.write(f"package {project_name}_pkg;\n\n")
-        
-        f.write(f"    // Filter parameters\n")
-        f.write(f"    parameter int NUM_TAPS = {len(fixed_coeffs)};\n")
-        f.write(f"    parameter int COEFF_WIDTH = {total_bits};\n")
-        f.write(f"    parameter int INT_BITS = {conversion_info['int_bits']};\n")
-        f.write(f"    parameter int FRAC_BITS = {conversion_info['frac_bits']};\n\n")
-        
-        f.write(f"    // Filter coefficients\n")
-        f.write(f"    parameter logic signed [COEFF_WIDTH-1:0] COEFFS [NUM_TAPS] = '{{\n")
-        
-        for i, coeff in enumerate(fixed_coeffs):
-            # Handle negative numbers in two's complement
-            if coeff < 0:
-                coeff_hex = f"{total_bits}'h{(2**total_bits + coeff):0{(total_bits+3)//4}X}"
-            else:
-                coeff_hex = f"{total_bits}'h{coeff:0{(total_bits+3)//4}X}"
-            
-            comma = "," if i < len(fixed_coeffs) - 1 else ""
-            f.write(f"        {coeff_hex}{comma}  // Tap {i}: {conversion_info['reconstructed_coeffs'][i]:.6f}\n")
-        
-        f.write(f"    }};\n\n")
-        f.write(f"endpackage\n")
+    parts.append("    };\n\n")
+    
+    if conversion_info['bit_compress']:
+        shifts = ", ".join(map(str, conversion_info['shifts'].tolist()))
+        parts.append(f"""    // Bit-compression shifts: shift each tap's product right by
+    // COEFF_SHIFTS[i] before accumulation
+    parameter int COEFF_SHIFTS [NUM_TAPS] = '{{{shifts}}};
+
+""")
+    
+    parts.append("endpackage\n")
+    
+    file_path.write_text("".join(parts))
 
 
 def _create_c_header_file(fixed_coeffs: np.ndarray, file_path: Path,
                          project_name: str, conversion_info: dict) -> None:
     """Create C header file with FIR coefficients."""
     total_bits = conversion_info['total_bits']
+    int_bits = conversion_info['int_bits']
+    frac_bits = conversion_info['frac_bits']
+    num_taps = len(fixed_coeffs)
+    guard = f"{project_name.upper()}_COEFFS_H"
+    
+    # Choose appropriate integer type
+    int_type, _ = _pick_int_type(total_bits)
+    
+    parts = [f"""/* FIR Filter Coefficients for {project_name} */
+/* Generated automatically from Python design */
+/* Format: Q{int_bits}.{frac_bits} */
+/* Total bits: {total_bits} */
+
+#ifndef {guard}
+#define {guard}
+
+#include <stdint.h>
+
+// Filter parameters
+#define NUM_TAPS {num_taps}
+#define COEFF_WIDTH {total_bits}
+#define INT_BITS {int_bits}
+#define FRAC_BITS {frac_bits}
+#define SCALE_FACTOR {conversion_info['scale_factor']}
+
+// Filter coefficients
+static const {int_type} fir_coeffs[NUM_TAPS] = {{
+"""]
     
-    with open(file_path, 'w') as f:
-        f.write(f"/* FIR Filter Coefficients for {project_name} */\n")
-        f.write(f"/* Generated automatically from Python design */\n")
-        f.write(f"/* Format: Q{conversion_info['int_bits']}.{conversion_info['frac_bits']} */\n")
-        f.write(f"/* Total bits: {total_bits} */\n\n")
-        
-        f.write(f"#ifndef {project_name.upper()}_COEFFS_H\n")
-        f.write(f"#define {project_name.upper()}_COEFFS_H\n\n")
-        
-        f.write(f"#include <stdint.h>\n\n")
-        
-        f.write(f"// Filter parameters\n")
-        f.write(f"#define NUM_TAPS {len(fixed_coeffs)}\n")
-        f.write(f"#define COEFF_WIDTH {total_bits}\n")
-        f.write(f"#define INT_BITS {conversion_info['int_bits']}\n")
-        f.write(f"#define FRAC_BITS {conversion_info['frac_bits']}\n")
-        f.write(f"#define SCALE_FACTOR {conversion_info['scale_factor']}\n\n")
-        
-        # Choose appropriate integer type
-        if total_bits <= 8:
-            int_type = "int8_t"
-        elif total_bits <= 16:
-            int_type = "int16_t"
-        elif total_bits <= 32:
-            int_type = "int32_t"
-        else:
-            int_type = "int64_t"
-        
-        f.write(f"// Filter coefficients\n")
-        f.write(f"static const {int_type} fir_coeffs[NUM_TAPS] = {{\n")
-        
-        for i, coeff in enumerate(fixed_coeffs):
-            comma = "," if i < len(fixed_coeffs) - 1 else ""
-            f.write(f"    {coeff}{comma}  /* Tap {i}: {conversion_info['reconstructed_coeffs'][i]:.6f} */\n")
-        
-        f.write(f"}};\n\n")
-        f.write(f"#endif /* {project_name.upper()}_COEFFS_H */\n")
+    # Plain Python scalars format much faster than NumPy ones
+    recon_values = conversion_info['reconstructed_coeffs'].tolist()
+    
+    commas = [","] * (num_taps - 1) + [""]
+    parts.extend(
+        f"    {coeff}{comma}  /* Tap {i}: {recon:.6f} */\n"
+        for i, (coeff, comma, recon) in enumerate(zip(fixed_coeffs.tolist(), commas, recon_values))
+    )
+    
+    parts.append("};\n\n")
+    
+    if conversion_info['bit_compress']:
+        shifts = ", ".join(map(str, conversion_info['shifts'].tolist()))
+        parts.append(f"""// Bit-compression shifts: shift each tap's product right by
+// fir_coeff_shifts[i] before accumulation
+static const uint8_t fir_coeff_shifts[NUM_TAPS] = {{{shifts}}};
+
+""")
+    
+    parts.append(f"#endif /* {guard} */\n")
+    
+    file_path.write_text("".join(parts))
 
 
 def _create_hex_file(fixed_coeffs: np.ndarray, file_path: Path, conversion_info: dict) -> None:
     """Create hexadecimal text file."""
     total_bits = conversion_info['total_bits']
     
-    with open(file_path, 'w') as f:
-        f.write(f"// FIR Filter Coefficients in Hexadecimal\n")
-        f.write(f"// Format: Q{conversion_info['int_bits']}.{conversion_info['frac_bits']}\n")
-        f.write(f"// Total bits: {total_bits}\n")
-        f.write(f"// One coefficient per line\n\n")
-        
-        for i, coeff in enumerate(fixed_coeffs):
-            if coeff < 0:
-                coeff_hex = f"{(2**total_bits + coeff):0{(total_bits+3)//4}X}"
-            else:
-                coeff_hex = f"{coeff:0{(total_bits+3)//4}X}"
-            f.write(f"{coeff_hex}\n")
+    parts = [f"""// FIR Filter Coefficients in Hexadecimal
+// Format: Q{conversion_info['int_bits']}.{conversion_info['frac_bits']}
+// Total bits: {total_bits}
+// One coefficient per line
+"""]
+    
+    if conversion_info['bit_compress']:
+        parts.append("""// Bit-compressed: shift each tap's product right by the matching
+// line of the _coeff_shifts.hex file before accumulation
+""")
+    
+    parts.append("\n")
+    parts.append(_ints_to_hex_lines(fixed_coeffs, total_bits))
+    
+    file_path.write_text("".join(parts))
+
+
+def _create_shifts_hex_file(shifts: np.ndarray, file_path: Path) -> None:
+    """Create hexadecimal text file of bit-compression shifts."""
+    file_path.write_text("""// FIR Filter Bit-Compression Shifts in Hexadecimal
+// Right shift applied to each tap's product before accumulation
+// One shift per line, in coefficient order
+
+""" + _ints_to_hex_lines(shifts, 8))
+
+
+def _ints_to_hex_lines(values: np.ndarray, total_bits: int) -> str:
+    """Zero-padded two's-complement hex of each value, one per newline-terminated line."""
+    # Masking to total_bits gives the two's complement of negative values
+    mask = (1 << total_bits) - 1
+    width = (total_bits + 3) // 4
+    words = np.asarray(values).astype(np.int64, copy=False)
+    if total_bits <= 64:
+        # Mask the same bit pattern as uint64 so a full 64-bit mask fits
+        masked = (words.view(np.uint64) & np.uint64(mask)).tolist()
+    else:
+        masked = [word & mask for word in words.tolist()]
+    return "".join(f"{word:0{width}X}\n" for word in masked)
 
 
 def _create_binary_file(fixed_coeffs: np.ndarray, file_path: Path, conversion_info: dict) -> None:
@@ -210,48 +316,62 @@ def _create_binary_file(fixed_coeffs: np.ndarray, file_path: Path, conversion_in
     total_bits = conversion_info['total_bits']
     
     # Choose appropriate numpy datatype
-    if total_bits <= 8:
-        dtype = np.int8
-    elif total_bits <= 16:
-        dtype = np.int16  
-    elif total_bits <= 32:
-        dtype = np.int32
-    else:
-        dtype = np.int64
+    _, dtype = _pick_int_type(total_bits)
     
-    # Convert to appropriate datatype and save
-    coeff_array = fixed_coeffs.astype(dtype)
+    # Convert to appropriate datatype and save; the byte order is pinned so the
+    # file is identical whichever host generated it
+    coeff_array: np.ndarray = fixed_coeffs.astype(np.dtype(dtype).newbyteorder('<'), copy=False)
     coeff_array.tofile(file_path)
 
 
+def _pick_int_type(total_bits: int) -> Tuple[str, type]:
+    """C type name and NumPy dtype for total_bits-wide signed values (int64 at most)."""
+    for limit, c_type, np_type in _INT_TYPE_TABLE:
+        if total_bits <= limit:
+            return c_type, np_type
+    return _INT_TYPE_TABLE[-1][1:]
+
+
 def _create_readme_file(file_path: Path, project_name: str, original_coeffs: np.ndarray,
                        conversion_info: dict, created_files: List[str]) -> None:
     """Create README file with design information."""
-    with open(file_path, 'w') as f:
-        f.write(f"FIR Filter Coefficient Export\n")
-        f.write(f"============================\n\n")
-        f.write(f"Project: {project_name}\n")
-        f.write(f"Generated: {np.datetime64('today')}\n\n")
-        
-        f.write(f"Filter Specifications:\n")
-        f.write(f"- Number of taps: {len(original_coeffs)}\n")
-        f.write(f"- Fixed-point format: Q{conversion_info['int_bits']}.{conversion_info['frac_bits']}\n")
-        f.write(f"- Total bits: {conversion_info['total_bits']}\n")
-        f.write(f"- Scale factor: {conversion_info['scale_factor']}\n")
-        f.write(f"- Max quantization error: {conversion_info['max_quantization_error']:.8f}\n")
-        f.write(f"- Mean quantization error: {conversion_info['mean_quantization_error']:.8f}\n")
-        f.write(f"- Overflow coefficients: {conversion_info['overflow_count']}\n\n")
-        
-        f.write(f"Generated Files:\n")
-        for file_name in created_files:
-            f.write(f"- {file_name}\n")
-        
-        f.write(f"\nFile Descriptions:\n")
-        f.write(f"- .sv files: SystemVerilog parameter packages\n")
-        f.write(f"- .h files: C header files\n") 
-        f.write(f"- .hex files: Hexadecimal text (one coefficient per line)\n")
-        f.write(f"- .bin files: Binary coefficient data\n")
-        f.write(f"- README.txt: This file\n")
+    parts = []
+    parts.append(f"FIR Filter Coefficient Export\n")
+    parts.append(f"============================\n\n")
+    parts.append(f"Project: {project_name}\n")
+    parts.append(f"Generated: {date.today().isoformat()}\n\n")
+    
+    parts.append(f"Filter Specifications:\n")
+    parts.append(f"- Number of taps: {len(original_coeffs)}\n")
+    parts.append(f"- Fixed-point format: Q{conversion_info['int_bits']}.{conversion_info['frac_bits']}\n")
+    parts.append(f"- Total bits: {conversion_info['total_bits']}\n")
+    parts.append(f"- Scale factor: {conversion_info['scale_factor']}\n")
+    parts.append(f"- Max quantization error: {conversion_info['max_quantization_error']:.8f}\n")
+    parts.append(f"- Mean quantization error: {conversion_info['mean_quantization_error']:.8f}\n")
+    parts.append(f"- Overflow coefficients: {conversion_info['overflow_count']}\n")
+    if conversion_info['bit_compress']:
+        requested_bits = conversion_info['int_bits'] + conversion_info['requested_frac_bits']
+        parts.append(f"- Bit compression: per-tap shifts {conversion_info['shifts'].min()}"
+                     f"..{conversion_info['shifts'].max()}, width reduced from "
+                     f"{requested_bits} to {conversion_info['total_bits']} bits\n")
+    parts.append("\n")
+    
+    parts.append(f"Generated Files:\n")
+    for file_name in created_files:
+        parts.append(f"- {file_name}\n")
+    
+    parts.append(f"\nFile Descriptions:\n")
+    parts.append(f"- .sv files: SystemVerilog parameter packages\n")
+    parts.append(f"- .h files: C header files\n") 
+    parts.append(f"- .hex files: Hexadecimal text (one coefficient per line)\n")
+    parts.append(f"- .bin files: Binary coefficient data (little-endian)\n")
+    if conversion_info['bit_compress']:
+        parts.append(f"- _coeff_shifts.hex/.bin files: Per-tap product right shifts "
+                     f"(hex text / one uint8 per tap); the coefficients are only "
+                     f"correct with these shifts applied\n")
+    parts.append(f"- README.txt: This file\n")
+    
+    file_path.write_text("".join(parts))
 
 
 def generate_fpga_testbench_data(
@@ -291,49 +411,28 @@ def generate_fpga_testbench_data(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    # Quantize signals to appropriate bit widths
-    input_scale = 2**(signal_bits-1)
-    output_scale = 2**(output_bits-1)
-    
-    input_int = (input_signal * input_scale).astype(np.int32)
-    output_int = (expected_output * output_scale).astype(np.int64)
-    
-    # Clip to prevent overflow
-    input_int = np.clip(input_int, -(2**(signal_bits-1)), 2**(signal_bits-1)-1)
-    output_int = np.clip(output_int, -(2**(output_bits-1)), 2**(output_bits-1)-1)
+    # Quantize signals to appropriate bit widths (round to nearest, saturate)
+    input_int = _quantize_signed(input_signal, signal_bits, np.int32)
+    output_int = _quantize_signed(expected_output, output_bits, np.int64)
     
     created_files = []
     
     # Generate input test vector
     input_file = output_path / f"{project_name}_input.txt"
-    with open(input_file, 'w') as f:
-        f.write(f"// FIR Filter Test Input Data\n")
-        f.write(f"// {len(input_int)} samples, {signal_bits} bits each\n\n")
-        for sample in input_int:
-            if hex_format:
-                if sample < 0:
-                    hex_val = f"{(2**signal_bits + sample):0{(signal_bits+3)//4}X}"
-                else:
-                    hex_val = f"{sample:0{(signal_bits+3)//4}X}"
-                f.write(f"{hex_val}\n")
-            else:
-                f.write(f"{sample}\n")
+    input_file.write_text(
+        f"// FIR Filter Test Input Data\n"
+        f"// {len(input_int)} samples, {signal_bits} bits each\n\n"
+        + _format_test_vector(input_int, signal_bits, hex_format)
+    )
     created_files.append(str(input_file))
     
     # Generate expected output vector
     output_file = output_path / f"{project_name}_expected.txt"
-    with open(output_file, 'w') as f:
-        f.write(f"// FIR Filter Expected Output Data\n")
-        f.write(f"// {len(output_int)} samples, {output_bits} bits each\n\n")
-        for sample in output_int:
-            if hex_format:
-                if sample < 0:
-                    hex_val = f"{(2**output_bits + sample):0{(output_bits+3)//4}X}"
-                else:
-                    hex_val = f"{sample:0{(output_bits+3)//4}X}"
-                f.write(f"{hex_val}\n")
-            else:
-                f.write(f"{sample}\n")
+    output_file.write_text(
+        f"// FIR Filter Expected Output Data\n"
+        f"// {len(output_int)} samples, {output_bits} bits each\n\n"
+        + _format_test_vector(output_int, output_bits, hex_format)
+    )
     created_files.append(str(output_file))
     
     # Generate SystemVerilog testbench template
@@ -352,11 +451,27 @@ def generate_fpga_testbench_data(
     }
 
 
+def _format_test_vector(samples: np.ndarray, bits: int, hex_format: bool) -> str:
+    """One sample per line, as bits-wide two's-complement hex or signed decimal."""
+    if hex_format:
+        return _ints_to_hex_lines(samples, bits)
+    return "".join(f"{sample}\n" for sample in samples.tolist())
+
+
+def _quantize_signed(signal: np.ndarray, bits: int, dtype: type) -> np.ndarray:
+    """Round a [-1, 1) signal to signed bits-wide integers, saturating at full scale."""
+    scale = 1 << (bits-1)
+    buf = np.multiply(signal, scale, dtype=np.float64)
+    np.rint(buf, out=buf)
+    np.clip(buf, -scale, scale - 1, out=buf)
+    quantized: np.ndarray = buf.astype(dtype)
+    return quantized
+
+
 def _create_testbench_template(file_path: Path, project_name: str, 
                              num_samples: int, input_bits: int, output_bits: int) -> None:
     """Create SystemVerilog testbench template."""
-    with open(file_path, 'w') as f:
-        f.write(f"""// FIR Filter Testbench Template
+    file_path.write_text(f"""// FIR Filter Testbench Template
 // Project: {project_name}
 
 `timescale 1ns/1ps
@@ -0,0 +1,14 @@
+"""
+Random Source Module
+
+This module holds the default random generator shared by the toolkit's
+simulators (ADC noise, modulation symbols and channel noise).
+"""
+
+import numpy as np
+
+
+# Default random source (PCG64) used when no Generator is passed. It is
+# independent of the legacy global state, so np.random.seed() has no effect
+# on it; pass np.random.default_rng(seed) for reproducible runs
+DEFAULT_GENERATOR = np.random.default_rng()
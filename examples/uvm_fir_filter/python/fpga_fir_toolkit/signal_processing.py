@@ -7,8 +7,23 @@ and transmission chain simulation for communications applications.
 
 import numpy as np
 import matplotlib.pyplot as plt
+from functools import lru_cache
+from scipy.ndimage import uniform_filter1d
+from scipy.signal import upfirdn
 from typing import Tuple, Optional, Union
 
+from .random_source import DEFAULT_GENERATOR
+
+
+# Samples per block in the vectorized EVM nearest-point search
+_EVM_BLOCK_SIZE = 65536
+# Signal length from which long filters run once on I + jQ rather than on stacked I/Q
+_IQ_COMPLEX_FFT_MIN_SAMPLES = 16384
+# Longest carrier kept in the carrier caches (4 MB as complex128, so at most
+# 32 MB per cache); longer carriers are rebuilt on each call instead of being
+# pinned for the life of the process
+_CARRIER_CACHE_MAX_SAMPLES = 1 << 18
+
 
 def generate_iq_signal(
     frequency: float,
@@ -17,6 +32,8 @@ def generate_iq_signal(
     amplitude: float = 1.0,
     phase_offset: float = 0.0,
     modulation_type: str = 'cw',
+    dtype: Optional[np.dtype] = None,
+    rng: Optional[np.random.Generator] = None,
     **kwargs
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
@@ -36,6 +53,13 @@ def generate_iq_signal(
         Phase offset in radians
     modulation_type : str, optional
         Modulation type ('cw', 'qpsk', 'qam16', 'chirp')
+    dtype : np.dtype, optional
+        Floating-point type of the I/Q samples (float64 if None). Phases and
+        the carrier are evaluated in float64 and the time vector stays float64.
+    rng : np.random.Generator, optional
+        Random generator for QPSK/16-QAM symbols. Defaults to the toolkit's
+        shared generator, which np.random.seed() does not affect; pass
+        np.random.default_rng(seed) for reproducible runs
     **kwargs
         Additional parameters for specific modulation types
         
@@ -53,31 +77,35 @@ def generate_iq_signal(
     num_samples = int(duration * sampling_rate)
     t = np.linspace(0, duration, num_samples, endpoint=False)
     
-    if modulation_type.lower() == 'cw':
+    complex_dtype = np.result_type(np.float64 if dtype is None else dtype, np.complex64)
+    rng = DEFAULT_GENERATOR if rng is None else rng
+    
+    modulation = modulation_type.lower()
+    if modulation in ('cw', 'qpsk', 'qam16'):
+        # Carrier shared by the fixed-frequency modulations (cached read-only)
+        carrier = _iq_carrier(frequency, duration, num_samples, phase_offset, complex_dtype)
+    
+    if modulation == 'cw':
         # Continuous wave
-        i_signal = amplitude * np.cos(2 * np.pi * frequency * t + phase_offset)
-        q_signal = amplitude * np.sin(2 * np.pi * frequency * t + phase_offset)
+        i_signal = amplitude * carrier.real
+        q_signal = amplitude * carrier.imag
         
-    elif modulation_type.lower() == 'qpsk':
+    elif modulation == 'qpsk':
         # QPSK modulation
         symbol_rate = kwargs.get('symbol_rate', frequency / 4)
         symbols_per_sample = sampling_rate / symbol_rate
         
-        # Generate random QPSK symbols
-        num_symbols = int(num_samples / symbols_per_sample) + 1
-        qpsk_symbols = np.random.choice([1+1j, 1-1j, -1+1j, -1-1j], num_symbols)
-        
-        # Upsample and pulse shape
-        upsampled = np.repeat(qpsk_symbols, int(symbols_per_sample))[:num_samples]
+        # Generate random QPSK symbols (integer draws indexing the constellation)
+        qpsk_points = np.array([1+1j, 1-1j, -1+1j, -1-1j])
+        num_symbols = _num_symbols(num_samples, symbols_per_sample)
+        qpsk_symbols = qpsk_points[rng.integers(0, 4, num_symbols)]
         
-        # Apply carrier
-        carrier_i = np.cos(2 * np.pi * frequency * t + phase_offset)
-        carrier_q = np.sin(2 * np.pi * frequency * t + phase_offset)
+        # Upsample (rectangular pulse) and apply carrier
+        qpsk_symbols = (amplitude * qpsk_symbols).astype(complex_dtype, copy=False)
+        modulated = _mix_held_symbols(qpsk_symbols, int(symbols_per_sample), carrier)
+        i_signal, q_signal = modulated.real, modulated.imag
         
-        i_signal = amplitude * np.real(upsampled) * carrier_i - amplitude * np.imag(upsampled) * carrier_q
-        q_signal = amplitude * np.real(upsampled) * carrier_q + amplitude * np.imag(upsampled) * carrier_i
-        
-    elif modulation_type.lower() == 'qam16':
+    elif modulation == 'qam16':
         # 16-QAM modulation
         symbol_rate = kwargs.get('symbol_rate', frequency / 8)
         symbols_per_sample = sampling_rate / symbol_rate
@@ -90,30 +118,30 @@ def generate_iq_signal(
             +3-3j, +3-1j, +3+1j, +3+3j
         ]) / 3.0  # Normalize
         
-        num_symbols = int(num_samples / symbols_per_sample) + 1
-        qam_symbols = np.random.choice(qam16_points, num_symbols)
-        
-        upsampled = np.repeat(qam_symbols, int(symbols_per_sample))[:num_samples]
-        
-        carrier_i = np.cos(2 * np.pi * frequency * t + phase_offset)
-        carrier_q = np.sin(2 * np.pi * frequency * t + phase_offset)
+        num_symbols = _num_symbols(num_samples, symbols_per_sample)
+        qam_symbols = qam16_points[rng.integers(0, 16, num_symbols)]
         
-        i_signal = amplitude * np.real(upsampled) * carrier_i - amplitude * np.imag(upsampled) * carrier_q
-        q_signal = amplitude * np.real(upsampled) * carrier_q + amplitude * np.imag(upsampled) * carrier_i
+        qam_symbols = (amplitude * qam_symbols).astype(complex_dtype, copy=False)
+        modulated = _mix_held_symbols(qam_symbols, int(symbols_per_sample), carrier)
+        i_signal, q_signal = modulated.real, modulated.imag
         
-    elif modulation_type.lower() == 'chirp':
+    elif modulation == 'chirp':
         # Linear frequency chirp
         f_start = kwargs.get('f_start', frequency)
         f_end = kwargs.get('f_end', frequency * 2)
         
-        # Instantaneous frequency
-        inst_freq = f_start + (f_end - f_start) * t / duration
+        # Phase is the running sum of the instantaneous frequency
+        # f_start + (f_end - f_start) * t / duration. That is an arithmetic
+        # series, so it is evaluated in closed form rather than by cumsum:
+        # sum_{k<=n} f(t_k) = (n + 1) * f(t_n / 2)
+        phase = f_start + (f_end - f_start) * t / (2 * duration)
+        phase *= np.arange(1, num_samples + 1)
+        phase *= 2 * np.pi / sampling_rate
+        phase += phase_offset
         
-        # Integrate to get phase
-        phase = 2 * np.pi * np.cumsum(inst_freq) / sampling_rate + phase_offset
-        
-        i_signal = amplitude * np.cos(phase)
-        q_signal = amplitude * np.sin(phase)
+        chirp = np.exp(1j * phase).astype(complex_dtype, copy=False)
+        i_signal = amplitude * chirp.real
+        q_signal = amplitude * chirp.imag
         
     else:
         raise ValueError(f"Unknown modulation type: {modulation_type}")
@@ -121,11 +149,60 @@ def generate_iq_signal(
     return t, i_signal, q_signal
 
 
+def _iq_carrier(frequency: float, duration: float, num_samples: int,
+                phase_offset: float, complex_dtype: np.dtype) -> np.ndarray:
+    """Complex carrier on generate_iq_signal's time grid (read-only)."""
+    if num_samples <= _CARRIER_CACHE_MAX_SAMPLES:
+        return _iq_carrier_cached(frequency, duration, num_samples, phase_offset, complex_dtype)
+    return _build_iq_carrier(frequency, duration, num_samples, phase_offset, complex_dtype)
+
+
+@lru_cache(maxsize=8)
+def _iq_carrier_cached(frequency: float, duration: float, num_samples: int,
+                       phase_offset: float, complex_dtype: np.dtype) -> np.ndarray:
+    """_build_iq_carrier for carriers short enough to cache."""
+    return _build_iq_carrier(frequency, duration, num_samples, phase_offset, complex_dtype)
+
+
+def _build_iq_carrier(frequency: float, duration: float, num_samples: int,
+                      phase_offset: float, complex_dtype: np.dtype) -> np.ndarray:
+    """Complex carrier behind _iq_carrier; returns a read-only array."""
+    # cos and sin come from a single complex exponential of a single phase ramp
+    t = np.linspace(0, duration, num_samples, endpoint=False)
+    carrier_phase = 2 * np.pi * frequency * t
+    carrier_phase += phase_offset
+    carrier: np.ndarray = np.exp(1j * carrier_phase).astype(complex_dtype, copy=False)
+    carrier.setflags(write=False)
+    return carrier
+
+
+def _num_symbols(num_samples: int, symbols_per_sample: float) -> int:
+    """Symbols to draw so that holding each for int(symbols_per_sample) samples covers num_samples."""
+    # int(num_samples / sps) + 1 falls short when sps is not a whole number
+    return max(int(num_samples / symbols_per_sample) + 1,
+               -(-num_samples // int(symbols_per_sample)))
+
+
+def _mix_held_symbols(symbols: np.ndarray, samples_per_symbol: int, carrier: np.ndarray) -> np.ndarray:
+    """Multiply a carrier by symbols held for samples_per_symbol samples each."""
+    # Mixing on a (symbols x samples_per_symbol) grid broadcasts each symbol
+    # along its row, so the upsampled symbol stream is never materialized
+    modulated = np.empty(len(carrier), dtype=np.result_type(symbols, carrier))
+    num_full = len(carrier) // samples_per_symbol
+    split = num_full * samples_per_symbol
+    grid = (num_full, samples_per_symbol)
+    np.multiply(symbols[:num_full, None], carrier[:split].reshape(grid), out=modulated[:split].reshape(grid))
+    if split < len(carrier):
+        np.multiply(symbols[num_full], carrier[split:], out=modulated[split:])
+    return modulated
+
+
 def apply_dual_iq_filter(
     i_signal: np.ndarray,
     q_signal: np.ndarray,
     filter_coefficients: np.ndarray,
     use_fixed_point: bool = False,
+    dtype: Optional[np.dtype] = None,
     **kwargs
 ) -> Tuple[np.ndarray, np.ndarray, dict]:
     """
@@ -141,6 +218,9 @@ def apply_dual_iq_filter(
         FIR filter coefficients
     use_fixed_point : bool, optional
         Use fixed-point arithmetic simulation
+    dtype : np.dtype, optional
+        Floating-point type for the floating-point path (e.g. np.float32).
+        By default the signals and coefficients are used as given.
     **kwargs
         Additional parameters for fixed-point processing
         
@@ -168,7 +248,7 @@ def apply_dual_iq_filter(
         i_filtered, i_info = apply_fixed_point_filter(i_signal, fixed_coeffs, frac_bits)
         q_filtered, q_info = apply_fixed_point_filter(q_signal, fixed_coeffs, frac_bits)
         
-        processing_info = {
+        processing_info: dict = {
             'filter_type': 'fixed_point',
             'conversion_info': conv_info,
             'i_channel_info': i_info,
@@ -176,11 +256,21 @@ def apply_dual_iq_filter(
         }
         
     else:
-        from .filter_design import apply_fir_filter
-        
-        # Apply floating-point filtering
-        i_filtered = apply_fir_filter(i_signal, filter_coefficients)
-        q_filtered = apply_fir_filter(q_signal, filter_coefficients)
+        from .filter_design import apply_fir_filter, _FFT_CONVOLVE_MIN_TAPS
+        
+        if dtype is not None:
+            i_signal = np.asarray(i_signal, dtype=dtype)
+            q_signal = np.asarray(q_signal, dtype=dtype)
+            filter_coefficients = np.asarray(filter_coefficients, dtype=dtype)
+        
+        if (len(filter_coefficients) >= _FFT_CONVOLVE_MIN_TAPS
+                and len(i_signal) >= _IQ_COMPLEX_FFT_MIN_SAMPLES):
+            # Real taps: one complex overlap-add pass over I + jQ filters both channels
+            iq_filtered = apply_fir_filter(i_signal + 1j * q_signal, filter_coefficients)
+            i_filtered, q_filtered = iq_filtered.real, iq_filtered.imag
+        else:
+            # Apply floating-point filtering to both channels in one call
+            i_filtered, q_filtered = apply_fir_filter(np.stack([i_signal, q_signal]), filter_coefficients, dtype=dtype)
         
         processing_info = {
             'filter_type': 'floating_point',
@@ -188,22 +278,35 @@ def apply_dual_iq_filter(
         }
     
     # Calculate IQ-specific metrics
-    original_power = np.mean(i_signal**2 + q_signal**2)
-    filtered_power = np.mean(i_filtered**2 + q_filtered**2)
+    # Mean power as dot products (no squared temporaries); vdot flattens, so
+    # n-D input averages over every element as np.mean did
+    original_power = (np.vdot(i_signal, i_signal) + np.vdot(q_signal, q_signal)) / np.size(i_signal)
+    filtered_power = (np.vdot(i_filtered, i_filtered) + np.vdot(q_filtered, q_filtered)) / np.size(i_filtered)
     
     original_magnitude = np.sqrt(i_signal**2 + q_signal**2)
     filtered_magnitude = np.sqrt(i_filtered**2 + q_filtered**2)
     
     processing_info.update({
         'power_ratio_db': 10 * np.log10(filtered_power / original_power) if original_power > 0 else float('-inf'),
-        'magnitude_correlation': np.corrcoef(original_magnitude, filtered_magnitude)[0,1],
-        'i_correlation': np.corrcoef(i_signal, i_filtered)[0,1],
-        'q_correlation': np.corrcoef(q_signal, q_filtered)[0,1]
+        'magnitude_correlation': _pearson(original_magnitude, filtered_magnitude),
+        'i_correlation': _pearson(i_signal, i_filtered),
+        'q_correlation': _pearson(q_signal, q_filtered)
     })
     
     return i_filtered, q_filtered, processing_info
 
 
+def _pearson(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation of two series over all elements (np.corrcoef(x, y)[0, 1] for 1-D input)."""
+    # Three dot products over the centred series instead of corrcoef's
+    # covariance-matrix route (2x2 matrix, stacked copy, separate std pass);
+    # vdot flattens, so n-D input is treated as one series
+    x_centred = x - np.mean(x)
+    y_centred = y - np.mean(y)
+    r = np.vdot(x_centred, y_centred) / np.sqrt(np.vdot(x_centred, x_centred) * np.vdot(y_centred, y_centred))
+    return float(np.clip(r, -1, 1))
+
+
 def simulate_transmission_chain(
     signal: np.ndarray,
     sampling_rate: float,
@@ -212,6 +315,8 @@ def simulate_transmission_chain(
     phase_noise_std: float = 0.01,
     frequency_offset: float = 0.0,
     add_multipath: bool = False,
+    dtype: Optional[np.dtype] = None,
+    rng: Optional[np.random.Generator] = None,
     **kwargs
 ) -> Tuple[np.ndarray, dict]:
     """
@@ -233,8 +338,18 @@ def simulate_transmission_chain(
         Frequency offset in Hz
     add_multipath : bool, optional
         Add multipath effects
+    dtype : np.dtype, optional
+        Floating-point type to convert the signal to and to generate the
+        carrier and noise in (e.g. np.float32). By default the signal is used
+        as given and the carrier and noise are float64. Carrier phases and
+        cosines are always evaluated in float64.
+    rng : np.random.Generator, optional
+        Random generator for phase and channel noise. Defaults to the toolkit's
+        shared generator, which np.random.seed() does not affect; pass
+        np.random.default_rng(seed) for reproducible runs
     **kwargs
-        Additional multipath parameters
+        Additional multipath parameters, demod_filter_taps and
+        decimation_factor (keep every D-th sample after the LPF)
         
     Returns:
     --------
@@ -246,31 +361,40 @@ def simulate_transmission_chain(
     >>> signal = np.sin(2*np.pi*1000*np.linspace(0,1,8000))
     >>> rx_signal, info = simulate_transmission_chain(signal, 8000, 10000)
     """
-    t = np.arange(len(signal)) / sampling_rate
+    if dtype is None:
+        dtype = np.dtype(np.float64)
+    else:
+        dtype = np.dtype(dtype)
+        signal = np.asarray(signal, dtype=dtype)
+    rng = DEFAULT_GENERATOR if rng is None else rng
     
     # Step 1: Modulation (upconvert to RF)
-    carrier_phase = 2 * np.pi * carrier_freq * t
-    if frequency_offset != 0:
-        carrier_phase += 2 * np.pi * frequency_offset * t
-    
-    # Add phase noise
     if phase_noise_std > 0:
-        phase_noise = np.cumsum(np.random.normal(0, phase_noise_std, len(signal)))
+        t = np.arange(len(signal)) / sampling_rate
+        carrier_phase = 2 * np.pi * carrier_freq * t
+        if frequency_offset != 0:
+            carrier_phase += 2 * np.pi * frequency_offset * t
+        
+        # Add phase noise
+        phase_noise = rng.standard_normal(len(signal))
+        phase_noise *= phase_noise_std
+        np.cumsum(phase_noise, out=phase_noise)
         carrier_phase += phase_noise
+        carrier = np.cos(carrier_phase).astype(dtype, copy=False)
     else:
-        phase_noise = np.zeros_like(signal)
+        # Without phase noise the carrier only depends on the frequencies and
+        # length, so repeated calls (e.g. noise sweeps) reuse it
+        carrier = _carrier_cosine(carrier_freq, frequency_offset, sampling_rate, len(signal), dtype)
     
     # Modulate
-    rf_signal = signal * np.cos(carrier_phase)
+    rf_signal = signal * carrier
     
     # Step 2: Channel effects
-    channel_signal = rf_signal.copy()
-    
     # Add AWGN
     signal_power = np.mean(rf_signal**2)
     noise_power_linear = signal_power * (10**(channel_noise_db/10))
-    channel_noise = np.sqrt(noise_power_linear) * np.random.normal(0, 1, len(rf_signal))
-    channel_signal += channel_noise
+    channel_noise = np.sqrt(noise_power_linear) * rng.standard_normal(len(rf_signal), dtype=dtype)
+    channel_signal = rf_signal + channel_noise
     
     # Multipath (simple 2-path model)
     if add_multipath:
@@ -278,22 +402,30 @@ def simulate_transmission_chain(
         attenuation_db = kwargs.get('multipath_attenuation_db', -6)
         
         if delay_samples < len(signal):
-            multipath_signal = np.zeros_like(channel_signal)
-            multipath_signal[delay_samples:] = channel_signal[:-delay_samples]
+            # The delayed path is zero before delay_samples, so only the tail
+            # is updated; the scaled slice is a fresh temporary, not a view
             attenuation_linear = 10**(attenuation_db/20)
-            channel_signal += attenuation_linear * multipath_signal
+            channel_signal[delay_samples:] += attenuation_linear * channel_signal[:len(signal) - delay_samples]
     
     # Step 3: Demodulation (downconvert)
     # Local oscillator (may have offset)
-    lo_phase = 2 * np.pi * carrier_freq * t
-    received_signal = 2 * channel_signal * np.cos(lo_phase)
+    lo_signal = _carrier_cosine(carrier_freq, 0.0, sampling_rate, len(signal), dtype)
+    received_signal = 2 * channel_signal * lo_signal
     
     # Low-pass filter to remove double frequency components
-    # (Simple moving average for demonstration)
+    # (Simple moving average for demonstration; uniform_filter1d keeps a
+    # running sum, so the cost does not grow with the number of taps. The
+    # zero padding and centring match np.convolve(..., mode='same').)
     filter_taps = kwargs.get('demod_filter_taps', 21)
-    if filter_taps > 1:
-        lpf_kernel = np.ones(filter_taps) / filter_taps
-        received_signal = np.convolve(received_signal, lpf_kernel, mode='same')
+    decimation_factor = kwargs.get('decimation_factor', 1)
+    if decimation_factor > 1 and 1 < filter_taps <= 2 * decimation_factor:
+        # Short kernel relative to D: only evaluate the retained outputs
+        received_signal = _decimate_box_filter(received_signal, filter_taps, decimation_factor)
+    else:
+        if filter_taps > 1:
+            received_signal = uniform_filter1d(received_signal, filter_taps, mode='constant')
+        if decimation_factor > 1:
+            received_signal = received_signal[::decimation_factor]
     
     # Calculate metrics
     snr_estimate = 10 * np.log10(signal_power / np.var(channel_noise))
@@ -307,7 +439,8 @@ def simulate_transmission_chain(
         'signal_power': signal_power,
         'noise_power': np.var(channel_noise),
         'multipath_enabled': add_multipath,
-        'demod_filter_taps': filter_taps
+        'demod_filter_taps': filter_taps,
+        'decimation_factor': decimation_factor
     }
     
     if add_multipath:
@@ -317,6 +450,44 @@ def simulate_transmission_chain(
     return received_signal, transmission_info
 
 
+def _carrier_cosine(carrier_freq: float, frequency_offset: float, sampling_rate: float,
+                    num_samples: int, dtype: np.dtype) -> np.ndarray:
+    """Noise-free cos(2*pi*(carrier_freq + frequency_offset)*t) (read-only)."""
+    if num_samples <= _CARRIER_CACHE_MAX_SAMPLES:
+        return _carrier_cosine_cached(carrier_freq, frequency_offset, sampling_rate, num_samples, dtype)
+    return _build_carrier_cosine(carrier_freq, frequency_offset, sampling_rate, num_samples, dtype)
+
+
+@lru_cache(maxsize=8)
+def _carrier_cosine_cached(carrier_freq: float, frequency_offset: float, sampling_rate: float,
+                           num_samples: int, dtype: np.dtype) -> np.ndarray:
+    """_build_carrier_cosine for carriers short enough to cache."""
+    return _build_carrier_cosine(carrier_freq, frequency_offset, sampling_rate, num_samples, dtype)
+
+
+def _build_carrier_cosine(carrier_freq: float, frequency_offset: float, sampling_rate: float,
+                          num_samples: int, dtype: np.dtype) -> np.ndarray:
+    """Cosine carrier behind _carrier_cosine; returns a read-only array."""
+    t = np.arange(num_samples) / sampling_rate
+    carrier_phase = 2 * np.pi * carrier_freq * t
+    if frequency_offset != 0:
+        carrier_phase += 2 * np.pi * frequency_offset * t
+    carrier: np.ndarray = np.cos(carrier_phase).astype(dtype, copy=False)
+    carrier.setflags(write=False)
+    return carrier
+
+
+def _decimate_box_filter(signal: np.ndarray, taps: int, factor: int) -> np.ndarray:
+    """Moving average matching np.convolve(..., mode='same')[::factor]."""
+    center = (taps - 1) // 2
+    # Pad so the centred output samples land on upfirdn's output grid
+    lead = -center % factor
+    padded = np.concatenate([np.zeros(lead, dtype=signal.dtype), signal]) if lead else signal
+    decimated: np.ndarray = upfirdn(np.full(taps, 1.0 / taps, dtype=signal.dtype), padded, down=factor)
+    start = (center + lead) // factor
+    return decimated[start:start + -(-len(signal) // factor)]
+
+
 def analyze_iq_constellation(
     i_signal: np.ndarray,
     q_signal: np.ndarray,
@@ -355,32 +526,48 @@ def analyze_iq_constellation(
     magnitude = np.abs(iq_complex)
     phase = np.angle(iq_complex)
     
+    magnitude_mean, magnitude_std = _mean_std(magnitude)
+    phase_mean, phase_std = _mean_std(phase)
+    i_mean, i_std = _mean_std(i_signal)
+    q_mean, q_std = _mean_std(q_signal)
+    
     metrics = {
         'num_samples': len(iq_complex),
-        'magnitude_mean': np.mean(magnitude),
-        'magnitude_std': np.std(magnitude),
+        'magnitude_mean': magnitude_mean,
+        'magnitude_std': magnitude_std,
         'magnitude_range': (np.min(magnitude), np.max(magnitude)),
-        'phase_mean': np.mean(phase),
-        'phase_std': np.std(phase),
+        'phase_mean': phase_mean,
+        'phase_std': phase_std,
         'phase_range': (np.min(phase), np.max(phase)),
-        'i_mean': np.mean(i_signal),
-        'i_std': np.std(i_signal),
-        'q_mean': np.mean(q_signal),
-        'q_std': np.std(q_signal),
-        'iq_correlation': np.corrcoef(i_signal, q_signal)[0,1]
+        'i_mean': i_mean,
+        'i_std': i_std,
+        'q_mean': q_mean,
+        'q_std': q_std,
+        'iq_correlation': _pearson(i_signal, q_signal)
     }
     
     # EVM calculation if reference provided
     if reference_constellation is not None:
-        evm_values = []
-        for sample in iq_complex:
-            # Find closest reference point
-            distances = np.abs(reference_constellation - sample)
-            closest_ref = reference_constellation[np.argmin(distances)]
-            error_vector = sample - closest_ref
-            evm_values.append(np.abs(error_vector))
-        
-        evm_rms = np.sqrt(np.mean(np.array(evm_values)**2))
+        reference_constellation = np.asarray(reference_constellation)
+        
+        # Find closest reference point for every sample at once, in blocks so
+        # the (samples x points) score matrix stays cache-sized. Since
+        # |z - r|^2 = |z|^2 - 2*Re(z*conj(r)) + |r|^2 and |z|^2 is common to
+        # every r, points are ranked by a (samples x 2) @ (2 x points)
+        # product rather than a sqrt per sample/point pair
+        ref_weights = -2 * np.stack([reference_constellation.real, reference_constellation.imag])
+        ref_power_terms = np.abs(reference_constellation)**2
+        # Interleaved (re, im) view of the complex buffer; no copy
+        iq_pairs = iq_complex.view(iq_complex.real.dtype).reshape(-1, 2)
+        error_power = 0.0
+        for start in range(0, len(iq_complex), _EVM_BLOCK_SIZE):
+            block = iq_complex[start:start + _EVM_BLOCK_SIZE]
+            scores = iq_pairs[start:start + _EVM_BLOCK_SIZE] @ ref_weights
+            scores += ref_power_terms
+            error_vectors = block - reference_constellation[np.argmin(scores, axis=1)]
+            error_power += np.sum(np.abs(error_vectors)**2)
+        
+        evm_rms = np.sqrt(error_power / len(iq_complex))
         ref_power = np.mean(np.abs(reference_constellation)**2)
         evm_percent = (evm_rms / np.sqrt(ref_power)) * 100
         
@@ -392,8 +579,10 @@ def analyze_iq_constellation(
     if plot_results:
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
         
-        # Constellation diagram
-        ax1.scatter(i_signal[::10], q_signal[::10], alpha=0.6, s=1)
+        # Constellation diagram (contiguous subsample: matplotlib makes
+        # several passes over the points, which are slower on strided views)
+        ax1.scatter(np.ascontiguousarray(i_signal[::10]), np.ascontiguousarray(q_signal[::10]),
+                    alpha=0.6, s=1)
         ax1.set_xlabel('I Channel')
         ax1.set_ylabel('Q Channel')
         ax1.set_title('IQ Constellation')
@@ -406,7 +595,8 @@ def analyze_iq_constellation(
             ax1.legend()
         
         # Magnitude histogram
-        ax2.hist(magnitude, bins=50, alpha=0.7, edgecolor='black')
+        # Passing the known range saves matplotlib another min/max pass
+        ax2.hist(magnitude, bins=50, range=metrics['magnitude_range'], alpha=0.7, edgecolor='black')
         ax2.set_xlabel('Magnitude')
         ax2.set_ylabel('Count')
         ax2.set_title('Magnitude Distribution')
@@ -418,6 +608,15 @@ def analyze_iq_constellation(
     return metrics
 
 
+def _mean_std(values: np.ndarray) -> Tuple[float, float]:
+    """Mean and population standard deviation over all elements, sharing one mean pass."""
+    mean = np.mean(values)
+    # Two-pass (centred) variance, as np.std, but the squares reduce in a BLAS
+    # dot; vdot flattens, so n-D input reduces over every element like np.std
+    deviations = values - mean
+    return mean, np.sqrt(np.vdot(deviations, deviations) / deviations.size)
+
+
 def plot_iq_signals(
     time_vector: np.ndarray,
     i_signal: np.ndarray,
@@ -466,14 +665,14 @@ def plot_iq_signals(
     
     # Frequency domain
     sampling_rate = 1 / (time_vector[1] - time_vector[0])
-    freqs = np.fft.fftfreq(len(i_signal), 1/sampling_rate)
-    i_fft = np.fft.fft(i_signal)
-    q_fft = np.fft.fft(q_signal)
+    # Both channels are real, so the one-sided rfft holds every plotted bin
+    freqs = np.fft.rfftfreq(len(i_signal), 1/sampling_rate)
+    i_fft = np.fft.rfft(i_signal)
+    q_fft = np.fft.rfft(q_signal)
     
     # Plot positive frequencies only
-    pos_mask = freqs >= 0
-    ax2.plot(freqs[pos_mask], 20*np.log10(np.abs(i_fft[pos_mask]) + 1e-10), 'b-', label='I Channel', alpha=0.8)
-    ax2.plot(freqs[pos_mask], 20*np.log10(np.abs(q_fft[pos_mask]) + 1e-10), 'r-', label='Q Channel', alpha=0.8)
+    ax2.plot(freqs, 20*np.log10(np.abs(i_fft) + 1e-10), 'b-', label='I Channel', alpha=0.8)
+    ax2.plot(freqs, 20*np.log10(np.abs(q_fft) + 1e-10), 'r-', label='Q Channel', alpha=0.8)
     ax2.set_xlabel('Frequency (Hz)')
     ax2.set_ylabel('Magnitude (dB)')
     ax2.set_title(f'{title} - Frequency Domain')
@@ -497,7 +696,8 @@ def plot_iq_signals(
     if plot_constellation and ax4 is not None:
         # Subsample for cleaner plot
         subsample = max(1, len(i_signal) // 1000)
-        ax4.scatter(i_signal[::subsample], q_signal[::subsample], alpha=0.6, s=1)
+        ax4.scatter(np.ascontiguousarray(i_signal[::subsample]), np.ascontiguousarray(q_signal[::subsample]),
+                    alpha=0.6, s=1)
         ax4.set_xlabel('I Channel')
         ax4.set_ylabel('Q Channel')
         ax4.set_title(f'{title} - Constellation')